@@ -1,8 +1,24 @@
 """ClickZetta Connector Comprehensive Functional Test Script"""
 
 import os
+import re
 import sys
 
+# Precompiled identifier validator (alphanumeric + underscore); \Z avoids the
+# trailing-newline special case of $ and compiling once skips re's cache lookup.
+_IDENT_RE = re.compile(r"^[a-zA-Z0-9_]+\Z")
+
+# Maps required CLICKZETTA_* environment variables to ClickZetta SDK argument names.
+KWARG_MAP = {
+    "CLICKZETTA_SERVICE": "service",
+    "CLICKZETTA_USERNAME": "username",
+    "CLICKZETTA_PASSWORD": "password",
+    "CLICKZETTA_INSTANCE": "instance",
+    "CLICKZETTA_WORKSPACE": "workspace",
+    "CLICKZETTA_SCHEMA": "schema",
+    "CLICKZETTA_VCLUSTER": "vcluster",
+}
+
 
 def main():
     print("=== ClickZetta Connector Comprehensive Functionality Test ===")
@@ -12,19 +28,11 @@ def main():
 
     # Test environment variable loading
     print("1. 📋 Environment Variable Validation")
-    required_vars = [
-        "CLICKZETTA_SERVICE",
-        "CLICKZETTA_USERNAME",
-        "CLICKZETTA_PASSWORD",
-        "CLICKZETTA_INSTANCE",
-        "CLICKZETTA_WORKSPACE",
-        "CLICKZETTA_SCHEMA",
-        "CLICKZETTA_VCLUSTER",
-    ]
+    # Snapshot the environment once instead of repeated os.getenv calls
+    env = {var: os.environ.get(var) for var in KWARG_MAP}
 
     missing_vars = []
-    for var in required_vars:
-        value = os.getenv(var)
+    for var, value in env.items():
         status = "✅" if value else "❌"
         display_value = "[HIDDEN]" if "PASSWORD" in var else value
         print(f"   {status} {var}: {display_value}")
@@ -42,15 +50,7 @@ def main():
     try:
         import clickzetta
 
-        connection = clickzetta.connect(
-            service=os.getenv("CLICKZETTA_SERVICE"),
-            username=os.getenv("CLICKZETTA_USERNAME"),
-            password=os.getenv("CLICKZETTA_PASSWORD"),
-            instance=os.getenv("CLICKZETTA_INSTANCE"),
-            workspace=os.getenv("CLICKZETTA_WORKSPACE"),
-            schema=os.getenv("CLICKZETTA_SCHEMA"),
-            vcluster=os.getenv("CLICKZETTA_VCLUSTER"),
-        )
+        connection = clickzetta.connect(**{arg: env[var] for var, arg in KWARG_MAP.items()})
         print("   ✅ ClickZetta SDK connection successful")
     except Exception as e:
         print(f"   ❌ ClickZetta SDK connection failed: {e}")
@@ -82,15 +82,13 @@ def main():
     print("4. 🗂️ Metadata Query Test")
     try:
         cursor = connection.cursor()
-        workspace = os.getenv("CLICKZETTA_WORKSPACE")
-        schema = os.getenv("CLICKZETTA_SCHEMA")
+        workspace = env["CLICKZETTA_WORKSPACE"]
+        schema = env["CLICKZETTA_SCHEMA"]
 
         # Validate identifiers to prevent injection (basic alphanumeric + underscore)
-        import re
-
-        if not workspace or not re.match(r"^[a-zA-Z0-9_]+$", workspace):
+        if not workspace or not _IDENT_RE.match(workspace):
             raise ValueError(f"Invalid workspace name: {workspace}")
-        if not schema or not re.match(r"^[a-zA-Z0-9_]+$", schema):
+        if not schema or not _IDENT_RE.match(schema):
             raise ValueError(f"Invalid schema name: {schema}")
 
         # Get table list (now safely validated)
@@ -2,20 +2,33 @@
 # Licensed under the Apache License, Version 2.0.
 # See http://www.apache.org/licenses/LICENSE-2.0 for details.
 
-from typing import Any, Dict, List, Union, override
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, override
 
 from datus.schemas.base import TABLE_TYPE
-from datus.tools.db_tools.base import list_to_in_str
+from datus.schemas.node_models import ExecuteSQLResult
 from datus.tools.db_tools.mixins import CatalogSupportMixin, MaterializedViewSupportMixin
 from datus.utils.constants import DBType
+from datus.utils.exceptions import DatusException, ErrorCode
 from datus.utils.loggings import get_logger
-from datus_mysql import MySQLConnector
+from datus_mysql import MySQLConfig, MySQLConnector
 from datus_mysql.connector import TableMetadataNames
 
 from .config import DorisConfig
 
 logger = get_logger(__name__)
 
+# Worker cap for concurrent SHOW CREATE calls; each worker checks out its own
+# connection from the SQLAlchemy pool (pool_size=10), so stay below that.
+_DDL_FETCH_WORKERS = 8
+
+# How long cached metadata listings stay fresh within a session.
+_METADATA_CACHE_TTL_SECONDS = 60.0
+
 
 # Doris metadata configuration uses information_schema.TABLES for all object types
 DORIS_METADATA_DICT: Dict[TABLE_TYPE, TableMetadataNames] = {
@@ -34,6 +47,66 @@ DORIS_METADATA_DICT: Dict[TABLE_TYPE, TableMetadataNames] = {
 }
 
 
+@dataclass(slots=True, frozen=True)
+class TableMeta:
+    """
+    Compact metadata row for one table/view/materialized view.
+
+    Slotted storage is markedly smaller than a six-key dict when listing
+    thousands of objects. Mapping-style access is kept so inherited consumers
+    that index rows by key continue to work; use ``as_dict()`` where a real
+    dict is required (e.g. serialized public returns).
+    """
+
+    identifier: str
+    catalog_name: str
+    schema_name: str
+    database_name: str
+    table_name: str
+    table_type: str
+
+    def __getitem__(self, key: str) -> str:
+        return getattr(self, key)
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        return getattr(self, key, default)
+
+    def as_dict(self) -> Dict[str, str]:
+        return {
+            "identifier": self.identifier,
+            "catalog_name": self.catalog_name,
+            "schema_name": self.schema_name,
+            "database_name": self.database_name,
+            "table_name": self.table_name,
+            "table_type": self.table_type,
+        }
+
+
+def _cached_metadata(func):
+    """
+    TTL-cache a metadata getter's result per call arguments.
+
+    Upstream tooling calls the listing methods repeatedly during planning while
+    catalog contents change on the scale of minutes; entries live in the
+    connector's ``_ttl_cache`` and are invalidated on catalog switch, DDL
+    execution, and close. Returns a shallow copy so callers can mutate freely.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        entry = self._ttl_cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < _METADATA_CACHE_TTL_SECONDS:
+            return list(entry[1])
+
+        value = func(self, *args, **kwargs)
+        self._ttl_cache[key] = (now, value)
+        return list(value)
+
+    return wrapper
+
+
 def _get_metadata_config(table_type: TABLE_TYPE) -> TableMetadataNames:
     """Get Doris metadata configuration for the given table type."""
 
@@ -43,11 +116,32 @@ def _get_metadata_config(table_type: TABLE_TYPE) -> TableMetadataNames:
     return DORIS_METADATA_DICT[table_type]
 
 
+# Doris error hint for async materialized views; compiled once so each check
+# avoids re-lowercasing the message and re-scanning it twice.
+_ASYNC_MV_HINT_RE = re.compile(r"not support async materialized view.*show create materialized view", re.I | re.S)
+
+# PyMySQL struct.pack cleanup errors that are safe to ignore on close; a single
+# alternation scans the message once instead of one pass per substring.
+_PYMYSQL_CLEANUP_RE = re.compile(r"struct\.error|struct\.pack|COMMAND\.COM_QUIT|required argument is not an integer")
+
+
+@lru_cache(maxsize=4096)
+def _full_name_cached(catalog_name: str, database_name: str, table_name: str) -> str:
+    """Build the backtick-quoted full name; pure string work called per row in hot loops."""
+
+    if catalog_name:
+        if database_name:
+            return f"`{catalog_name}`.`{database_name}`.`{table_name}`"
+        return f"`{table_name}`"
+    if database_name:
+        return f"`{database_name}`.`{table_name}`"
+    return f"`{table_name}`"
+
+
 def _is_async_mv_hint(error: Exception) -> bool:
     """Return True if the error message indicates an async materialized view."""
 
-    error_lower = str(error).lower()
-    return "not support async materialized view" in error_lower and "show create materialized view" in error_lower
+    return bool(_ASYNC_MV_HINT_RE.search(str(error)))
 
 
 class DorisConnector(MySQLConnector, CatalogSupportMixin, MaterializedViewSupportMixin):
@@ -72,9 +166,9 @@ class DorisConnector(MySQLConnector, CatalogSupportMixin, MaterializedViewSuppor
 
         self.doris_config = config
 
-        from datus_mysql import MySQLConfig
-
-        mysql_config = MySQLConfig(
+        # Values were already validated by DorisConfig above; model_construct
+        # skips a second round of pydantic validation on the pass-through copy.
+        mysql_config = MySQLConfig.model_construct(
             host=config.host,
             port=config.port,
             username=config.username,
@@ -88,6 +182,52 @@ class DorisConnector(MySQLConnector, CatalogSupportMixin, MaterializedViewSuppor
 
         self.catalog_name = config.catalog
 
+        # Resolved default catalog, cached so the hot _resolved_catalog path
+        # avoids a method call per lookup.
+        self._default_catalog = self.default_catalog()
+
+        # Lazily-initialized snapshot of _sys_databases(); stable per connection.
+        self._sys_databases_cache: tuple[str, ...] | None = None
+
+        # Prebuilt "TABLE_SCHEMA NOT IN (...)" fragment and its bind params, so
+        # repeated metadata queries don't rebuild placeholders per call.
+        self._sys_not_in_cache: Optional[Tuple[str, Dict[str, str]]] = None
+
+        # SHOW CATALOGS result, cached per session; cleared on switch_catalog
+        # since new catalogs may have been created elsewhere.
+        self._catalogs_cache: Optional[List[str]] = None
+        self._catalogs_cache_set: Optional[frozenset[str]] = None
+
+        # Memoized MV classification; metadata listings are called repeatedly on
+        # the same object set within a session. Cleared on catalog switch/close.
+        self._mv_cache: Dict[Tuple[str, str, str], bool] = {}
+        # Last SHOW CREATE variant known to work per object, so async MVs skip
+        # the guaranteed-to-fail SHOW CREATE TABLE round trip on repeat calls.
+        self._create_variant_cache: Dict[str, str] = {}
+        # DDL captured as a side effect of MV classification probes, consumed
+        # once by the next _show_create for the same object
+        self._probe_ddl_cache: Dict[str, str] = {}
+
+        # Memoized identifier strings; identifier() is pure string formatting
+        # but sits inside the per-row metadata loops.
+        self._identifier_cache: Dict[Tuple[str, str, str], str] = {}
+
+        # TTL cache for metadata listings keyed by (table_type, catalog, database);
+        # agents commonly call get_tables/get_views/get_materialized_views in
+        # sequence, each of which would otherwise rescan information_schema.
+        self._metadata_cache: Dict[Tuple[str, str, str], Tuple[float, List[TableMeta]]] = {}
+
+        # TTL cache for the combined (db, name, type) object listing shared by the
+        # three name-listing methods.
+        self._all_objects_cache: Dict[Tuple[str, str], Tuple[float, List[Tuple[str, str, str]]]] = {}
+
+        # Backing store for the @_cached_metadata decorator on listing methods.
+        self._ttl_cache: Dict[Any, Tuple[float, List[str]]] = {}
+
+        # Shared bounded pool for concurrent DDL fetches, created on first use
+        # and shut down in close(); avoids spinning up a pool per call.
+        self._ddl_pool: Optional[ThreadPoolExecutor] = None
+
         # Override dialect to Doris
         self.dialect = DBType.DORIS
 
@@ -113,10 +253,20 @@ class DorisConnector(MySQLConnector, CatalogSupportMixin, MaterializedViewSuppor
     @override
     def get_catalogs(self) -> List[str]:
         """Get list of catalogs."""
-        result = self._execute_pandas("SHOW CATALOGS")
-        if result.empty:
-            return []
-        return result["Catalog"].tolist()
+        if self._catalogs_cache is not None:
+            return list(self._catalogs_cache)
+
+        columns, rows = self._execute_keyed_tuples("SHOW CATALOGS")
+        catalog_idx = columns.index("Catalog") if rows else 0
+        self._catalogs_cache = [row[catalog_idx] for row in rows]
+        self._catalogs_cache_set = frozenset(self._catalogs_cache)
+        return list(self._catalogs_cache)
+
+    def _has_catalog(self, catalog_name: str) -> bool:
+        """O(1) catalog membership check against the cached catalog listing."""
+        if self._catalogs_cache_set is None:
+            self.get_catalogs()
+        return catalog_name in self._catalogs_cache_set
 
     @override
     def switch_catalog(self, catalog_name: str) -> None:
@@ -124,26 +274,55 @@ class DorisConnector(MySQLConnector, CatalogSupportMixin, MaterializedViewSuppor
 
         Args:
             catalog_name: Name of the catalog to switch to
+
+        Raises:
+            DatusException: If the catalog does not exist.
         """
+        # Validate against the cached listing before mutating connector state;
+        # a failed SWITCH would otherwise leave catalog_name pointing at a
+        # catalog the sessions never entered.
+        if not self._has_catalog(catalog_name):
+            raise DatusException(ErrorCode.COMMON_FIELD_INVALID, f"Unknown catalog '{catalog_name}'")
         self.switch_context(catalog_name=catalog_name)
         self.catalog_name = catalog_name
+        self._catalogs_cache = None
+        self._catalogs_cache_set = None
+        self._ttl_cache.clear()
+        self._mv_cache.clear()
+        self._metadata_cache.clear()
+        self._all_objects_cache.clear()
 
     def reset_catalog_to_default(self, catalog: str) -> str:
         """Reset the catalog to the default catalog if it is not set or is 'def'."""
-        if not catalog or catalog == "def":
-            return self.default_catalog()
-        return catalog
+        # Hot path first: callers almost always pass a real catalog name.
+        if catalog and catalog != "def":
+            return catalog
+        return self._default_catalog
 
     def _resolved_catalog(self, catalog_name: str = "") -> str:
         """Return the effective catalog, preferring the configured catalog when unset."""
 
+        # Inlined reset_catalog_to_default: called per row via full_name, so keep
+        # this branch-only without extra method dispatch. An explicit "def"
+        # maps to the default catalog, not the currently configured one.
         if catalog_name:
-            return self.reset_catalog_to_default(catalog_name)
-
-        if self.catalog_name:
-            return self.catalog_name
-
-        return self.default_catalog()
+            return catalog_name if catalog_name != "def" else self._default_catalog
+        return self.catalog_name or self._default_catalog
+
+    def _cached_sys_databases(self) -> tuple[str, ...]:
+        """Return the system database names as a cached, sorted tuple."""
+        if self._sys_databases_cache is None:
+            self._sys_databases_cache = tuple(sorted(self._sys_databases()))
+        return self._sys_databases_cache
+
+    def _sys_databases_not_in(self) -> Tuple[str, Dict[str, str]]:
+        """Return the cached ``TABLE_SCHEMA NOT IN (...)`` fragment with its bind params."""
+        if self._sys_not_in_cache is None:
+            sys_databases = self._cached_sys_databases()
+            placeholders = ", ".join(f":sys_{i}" for i in range(len(sys_databases)))
+            params = {f"sys_{i}": name for i, name in enumerate(sys_databases)}
+            self._sys_not_in_cache = (f"TABLE_SCHEMA NOT IN ({placeholders})", params)
+        return self._sys_not_in_cache
 
     def _before_metadata_query(self, catalog_name: str = "", database_name: str = "") -> None:
         """Switch catalog before metadata queries if needed."""
@@ -151,6 +330,18 @@ class DorisConnector(MySQLConnector, CatalogSupportMixin, MaterializedViewSuppor
         if target_catalog and target_catalog != self.catalog_name:
             self.switch_context(catalog_name=target_catalog)
 
+    def _execute_metadata_tuples(self, catalog_name: str, sql: str, params: Dict[str, Any]) -> List[Tuple[Any, ...]]:
+        """
+        Run a metadata query scoped to a catalog.
+
+        Catalog SWITCH state lives on the DBAPI session, and every call here
+        may check out a different pooled connection, so the SWITCH preamble is
+        sent unconditionally on the same checkout the query runs on rather
+        than tracked on the connector.
+        """
+        preamble = f"SWITCH {self._quote_identifier(catalog_name)}" if catalog_name else None
+        return self._execute_tuples(sql, params, preamble=preamble)
+
     # ==================== Metadata Retrieval ====================
 
     def _get_metadata(
@@ -158,7 +349,8 @@ class DorisConnector(MySQLConnector, CatalogSupportMixin, MaterializedViewSuppor
         table_type: str = "table",
         catalog_name: str = "",
         database_name: str = "",
-    ) -> List[Dict[str, str]]:
+        table_names: Optional[List[str]] = None,
+    ) -> List[TableMeta]:
         """
         Get metadata for tables/views with catalog support.
 
@@ -166,83 +358,171 @@ class DorisConnector(MySQLConnector, CatalogSupportMixin, MaterializedViewSuppor
             table_type: Type of object (table, view, mv)
             catalog_name: Catalog name
             database_name: Database name to query
+            table_names: Optional table names to push into the SQL filter,
+                skipping row scans and MV probes for out-of-filter objects
 
         Returns:
-            List of metadata dictionaries with catalog_name properly set
+            List of TableMeta rows with catalog_name properly set
         """
         current_catalog = self._resolved_catalog(catalog_name)
 
-        self._before_metadata_query(catalog_name=current_catalog, database_name=database_name)
-
         self.connect()
         database_name = database_name or self.database_name
 
+        cache_key = (table_type, current_catalog, database_name)
+        if table_names is None:
+            cached = self._metadata_cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < _METADATA_CACHE_TTL_SECONDS:
+                return list(cached[1])
+
+            # Unfiltered listings share the combined single-query fetch, so
+            # get_tables/get_views/get_*_with_ddl all ride on one round-trip.
+            objects = self._list_all_objects(catalog_name=current_catalog, database_name=database_name)
+            items = [
+                TableMeta(
+                    identifier=self._identifier_for(current_catalog, db_name, tb_name),
+                    catalog_name=current_catalog,
+                    schema_name="",
+                    database_name=db_name,
+                    table_name=tb_name,
+                    table_type=table_type,
+                )
+                for db_name, tb_name, obj_type in objects
+                if obj_type == table_type
+            ]
+            self._metadata_cache[cache_key] = (time.monotonic(), items)
+            return items
+
+        # Bind parameters instead of interpolating literals so the query text is
+        # stable across databases/types and the server can reuse a cached plan.
+        params: Dict[str, Any] = {}
+
         if database_name:
-            where = f"TABLE_SCHEMA = '{database_name}'"
+            where = "TABLE_SCHEMA = :table_schema"
+            params["table_schema"] = database_name
         else:
-            where = f"{list_to_in_str('TABLE_SCHEMA not in', list(self._sys_databases()))}"
+            where, sys_params = self._sys_databases_not_in()
+            params.update(sys_params)
 
         metadata_config = _get_metadata_config(table_type)
-        type_filter = list_to_in_str("and TABLE_TYPE in ", metadata_config.table_types)
+        type_placeholders = ", ".join(f":type_{i}" for i in range(len(metadata_config.table_types)))
+        type_filter = f" AND TABLE_TYPE IN ({type_placeholders})"
+        for i, name in enumerate(metadata_config.table_types):
+            params[f"type_{i}"] = name
+
+        name_filter = ""
+        if table_names:
+            name_placeholders = ", ".join(f":tbl_{i}" for i in range(len(table_names)))
+            name_filter = f" AND TABLE_NAME IN ({name_placeholders})"
+            for i, name in enumerate(table_names):
+                params[f"tbl_{i}"] = name
 
         query = (
             f"SELECT TABLE_SCHEMA, TABLE_NAME "
             f"FROM information_schema.{metadata_config.info_table} "
-            f"WHERE {where} {type_filter}"
+            f"WHERE {where}{type_filter}{name_filter}"
         )
 
-        query_result = self._execute_pandas(query)
+        rows = self._execute_metadata_tuples(current_catalog, query, params)
+
+        # Views are fully resolved by the TABLE_TYPE filter above; build items in
+        # a single comprehension with no per-row classification overhead.
+        if table_type not in {"table", "mv"}:
+            items = [
+                TableMeta(
+                    identifier=self._identifier_for(current_catalog, db_name, tb_name),
+                    catalog_name=current_catalog,
+                    schema_name="",
+                    database_name=db_name,
+                    table_name=tb_name,
+                    table_type=table_type,
+                )
+                for db_name, tb_name in rows
+            ]
+            return items
+
+        # Doris reports both tables and materialized views as BASE TABLE; classify
+        # each row (batched listing with per-row probe fallback, both memoized).
+        mv_names_by_db: Dict[str, Optional[Set[str]]] = {}
 
         filtered_result = []
-        for i in range(len(query_result)):
-            db_name = query_result["TABLE_SCHEMA"][i]
-            tb_name = query_result["TABLE_NAME"][i]
+        for db_name, tb_name in rows:
+            is_mv = self._classify_is_mv(current_catalog, db_name, tb_name, mv_names_by_db)
 
-            full_name = self.full_name(
-                catalog_name=current_catalog, database_name=db_name, table_name=tb_name
-            )
+            if table_type == "mv" and not is_mv:
+                continue
+            if table_type == "table" and is_mv:
+                continue
 
-            # Doris reports both tables and materialized views as BASE TABLE. Use SHOW
-            # CREATE TABLE error hints to distinguish materialized views.
-            if table_type in {"table", "mv"}:
-                try:
-                    is_mv = self._is_materialized_view(full_name)
-                except Exception as e:
-                    logger.warning(f"Could not determine if {full_name} is a materialized view: {e}")
-                    is_mv = False
-
-                if table_type == "mv" and not is_mv:
-                    continue
-                if table_type == "table" and is_mv:
-                    continue
-
-            item = {
-                "identifier": self.identifier(
-                    catalog_name=current_catalog, database_name=db_name, table_name=tb_name
-                ),
-                "catalog_name": current_catalog,
-                "schema_name": "",
-                "database_name": db_name,
-                "table_name": tb_name,
-                "table_type": table_type,
-            }
-
-            filtered_result.append(item)
+            filtered_result.append(
+                TableMeta(
+                    identifier=self._identifier_for(current_catalog, db_name, tb_name),
+                    catalog_name=current_catalog,
+                    schema_name="",
+                    database_name=db_name,
+                    table_name=tb_name,
+                    table_type=table_type,
+                )
+            )
 
         return filtered_result
 
+    def _list_all_objects(self, catalog_name: str = "", database_name: str = "") -> List[Tuple[str, str, str]]:
+        """
+        List all tables, views, and materialized views in one pass.
+
+        A single information_schema scan (plus one MV listing per database)
+        yields ``(database, name, type)`` tuples that the three name-listing
+        methods slice, instead of each issuing its own typed query.
+        """
+        current_catalog = self._resolved_catalog(catalog_name)
+
+        self.connect()
+        database_name = database_name or self.database_name
+
+        cache_key = (current_catalog, database_name)
+        cached = self._all_objects_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _METADATA_CACHE_TTL_SECONDS:
+            return list(cached[1])
+
+        params: Dict[str, Any] = {}
+        if database_name:
+            where = "TABLE_SCHEMA = :table_schema"
+            params["table_schema"] = database_name
+        else:
+            where, sys_params = self._sys_databases_not_in()
+            params.update(sys_params)
+
+        query = f"SELECT TABLE_SCHEMA, TABLE_NAME, TABLE_TYPE FROM information_schema.TABLES WHERE {where}"
+        rows = self._execute_metadata_tuples(current_catalog, query, params)
+
+        mv_names_by_db: Dict[str, Optional[Set[str]]] = {}
+        objects: List[Tuple[str, str, str]] = []
+        for db_name, tb_name, raw_type in rows:
+            if str(raw_type).upper() == "VIEW":
+                objects.append((db_name, tb_name, "view"))
+            elif self._classify_is_mv(current_catalog, db_name, tb_name, mv_names_by_db):
+                objects.append((db_name, tb_name, "mv"))
+            else:
+                objects.append((db_name, tb_name, "table"))
+
+        self._all_objects_cache[cache_key] = (time.monotonic(), objects)
+        return objects
+
     @override
+    @_cached_metadata
     def get_tables(self, catalog_name: str = "", database_name: str = "", schema_name: str = "") -> List[str]:
         """Get list of table names."""
-        result = self._get_metadata(table_type="table", catalog_name=catalog_name, database_name=database_name)
-        return [table["table_name"] for table in result]
+        objects = self._list_all_objects(catalog_name=catalog_name, database_name=database_name)
+        return [name for _db, name, obj_type in objects if obj_type == "table"]
 
     @override
+    @_cached_metadata
     def get_views(self, catalog_name: str = "", database_name: str = "", schema_name: str = "") -> List[str]:
         """Get list of view names."""
         try:
-            result = self._get_metadata(table_type="view", catalog_name=catalog_name, database_name=database_name)
-            return [view["table_name"] for view in result]
+            objects = self._list_all_objects(catalog_name=catalog_name, database_name=database_name)
+            return [name for _db, name, obj_type in objects if obj_type == "view"]
         except Exception as e:
             logger.warning(f"Failed to get views: {e}")
             return []
@@ -252,8 +532,8 @@ class DorisConnector(MySQLConnector, CatalogSupportMixin, MaterializedViewSuppor
     ) -> List[str]:
         """Get list of materialized view names."""
         try:
-            result = self._get_metadata(table_type="mv", catalog_name=catalog_name, database_name=database_name)
-            return [mv["table_name"] for mv in result]
+            objects = self._list_all_objects(catalog_name=catalog_name, database_name=database_name)
+            return [name for _db, name, obj_type in objects if obj_type == "mv"]
         except Exception as e:
             logger.warning(f"Failed to get materialized views: {e}")
             return []
@@ -272,23 +552,36 @@ class DorisConnector(MySQLConnector, CatalogSupportMixin, MaterializedViewSuppor
         filter_tables = self._reset_filter_tables(tables, catalog_name, database_name)
         metadata_config = _get_metadata_config(table_type)
 
-        for meta in self._get_metadata(table_type, catalog_name, database_name):
+        # Push the bare table names into the metadata query so out-of-filter rows
+        # are never fetched, scanned, or probed for MV classification.
+        table_names = None
+        if tables:
+            table_names = [t.rsplit(".", 1)[-1].strip("`") for t in tables]
+
+        surviving = []
+        for meta in self._get_metadata(table_type, catalog_name, database_name, table_names=table_names):
             full_name = self.full_name(
-                catalog_name=meta.get("catalog_name", ""),
-                database_name=meta["database_name"],
-                table_name=meta["table_name"],
+                catalog_name=meta.catalog_name,
+                database_name=meta.database_name,
+                table_name=meta.table_name,
             )
 
             if filter_tables and full_name not in filter_tables:
                 continue
 
-            try:
-                ddl = self._show_create(full_name, metadata_config.show_create_table)
-            except Exception as e:
-                logger.warning(f"Could not get DDL for {full_name}: {e}")
-                ddl = f"-- DDL not available for {full_name}"
+            surviving.append((meta, full_name))
 
-            result.append({**meta, "definition": ddl})
+        if not surviving:
+            return result
+
+        # DDL fetches are network-bound single round-trips; issue them concurrently,
+        # preserving input order via executor.map.
+        ddls = self._ddl_executor().map(
+            lambda full_name: self._show_create_safe(full_name, metadata_config.show_create_table),
+            [full_name for _, full_name in surviving],
+        )
+        for (meta, _), ddl in zip(surviving, ddls):
+            result.append({**meta.as_dict(), "definition": ddl})
 
         return result
 
@@ -315,22 +608,18 @@ class DorisConnector(MySQLConnector, CatalogSupportMixin, MaterializedViewSuppor
             logger.warning(f"Failed to list materialized views for DDL retrieval: {e}")
             return []
 
-        mv_list = []
-        for mv in mv_metadata:
-            identifier = mv["identifier"]
-            full_name = self.full_name(
-                catalog_name=current_catalog, database_name=mv["database_name"], table_name=mv["table_name"]
-            )
-
-            try:
-                definition = self._show_create(full_name, "MATERIALIZED VIEW")
-            except Exception as e:  # pragma: no cover - best-effort retrieval
-                logger.warning(f"Failed to get DDL for {identifier}: {e}")
-                definition = f"-- DDL not available for {identifier}"
+        if not mv_metadata:
+            return []
 
-            mv_list.append({**mv, "definition": definition})
+        full_names = [
+            self.full_name(catalog_name=current_catalog, database_name=mv.database_name, table_name=mv.table_name)
+            for mv in mv_metadata
+        ]
 
-        return mv_list
+        definitions = self._ddl_executor().map(
+            lambda full_name: self._show_create_safe(full_name, "MATERIALIZED VIEW"), full_names
+        )
+        return [{**mv.as_dict(), "definition": definition} for mv, definition in zip(mv_metadata, definitions)]
 
     @override
     def _show_create(self, full_name: str, create_type: str) -> str:
@@ -340,38 +629,176 @@ class DorisConnector(MySQLConnector, CatalogSupportMixin, MaterializedViewSuppor
         Doris may return an async materialized view error when using TABLE
         metadata, instructing callers to use ``SHOW CREATE MATERIALIZED VIEW``.
         In that case, retry with the materialized view command; otherwise
-        respect the requested ``create_type``.
+        respect the requested ``create_type``. The working variant is memoized
+        per object so later calls go straight to the right command instead of
+        repeating the failing attempt.
         """
+        probed = self._probe_ddl_cache.pop(full_name, None)
+        if probed is not None:
+            return probed
+
+        known_variant = self._create_variant_cache.get(full_name)
+        if known_variant is not None:
+            create_type = known_variant
+
         try:
-            return super()._show_create(full_name, create_type)
+            ddl = super()._show_create(full_name, create_type)
         except Exception as e:
             if _is_async_mv_hint(e):
                 logger.debug(f"Retrying SHOW CREATE MATERIALIZED VIEW for {full_name} after async MV hint: {e}")
-                return super()._show_create(full_name, "MATERIALIZED VIEW")
+                ddl = super()._show_create(full_name, "MATERIALIZED VIEW")
+                self._create_variant_cache[full_name] = "MATERIALIZED VIEW"
+                return ddl
 
             raise
 
+        self._create_variant_cache[full_name] = create_type
+        return ddl
+
+    def _classify_is_mv(
+        self,
+        current_catalog: str,
+        db_name: str,
+        tb_name: str,
+        mv_names_by_db: Dict[str, Optional[Set[str]]],
+    ) -> bool:
+        """
+        Classify one BASE TABLE row as materialized view or plain table.
+
+        Consults the per-session memo first, then the batched per-database MV
+        listing, falling back to a SHOW CREATE probe only when the listing is
+        unavailable. ``mv_names_by_db`` is the caller's per-invocation cache of
+        batched listings.
+        """
+
+        cache_key = (current_catalog, db_name, tb_name)
+        is_mv = self._mv_cache.get(cache_key)
+        if is_mv is not None:
+            return is_mv
+
+        if db_name not in mv_names_by_db:
+            mv_names_by_db[db_name] = self._materialized_view_names(current_catalog, db_name)
+        mv_names = mv_names_by_db[db_name]
+
+        if mv_names is not None:
+            is_mv = tb_name in mv_names
+        else:
+            full_name = self.full_name(catalog_name=current_catalog, database_name=db_name, table_name=tb_name)
+            try:
+                is_mv = self._is_materialized_view(full_name)
+            except Exception as e:
+                # The probe did not reach a verdict (transport error, missing
+                # privilege); treat the row as a plain table for this listing
+                # but leave the memo empty so a healthy session re-checks.
+                logger.warning(f"Could not determine if {full_name} is a materialized view: {e}")
+                return False
+
+        self._mv_cache[cache_key] = is_mv
+        return is_mv
+
+    def _ddl_executor(self) -> ThreadPoolExecutor:
+        """Return the shared DDL fetch pool, creating it on first use."""
+        if self._ddl_pool is None:
+            self._ddl_pool = ThreadPoolExecutor(max_workers=_DDL_FETCH_WORKERS, thread_name_prefix="doris-ddl")
+        return self._ddl_pool
+
+    def _identifier_for(self, catalog_name: str, database_name: str, table_name: str) -> str:
+        """Memoized identifier construction for the hot metadata loops."""
+        key = (catalog_name, database_name, table_name)
+        ident = self._identifier_cache.get(key)
+        if ident is None:
+            ident = self.identifier(catalog_name=catalog_name, database_name=database_name, table_name=table_name)
+            self._identifier_cache[key] = ident
+        return ident
+
+    def _show_create_safe(self, full_name: str, create_type: str) -> str:
+        """Fetch DDL via _show_create, returning a placeholder comment on failure."""
+
+        try:
+            return self._show_create(full_name, create_type)
+        except Exception as e:
+            logger.warning(f"Could not get DDL for {full_name}: {e}")
+            return f"-- DDL not available for {full_name}"
+
+    def _materialized_view_names(self, catalog_name: str, database_name: str) -> Optional[Set[str]]:
+        """
+        List async materialized view names for a database in a single query.
+
+        Uses ``SHOW MATERIALIZED VIEWS FROM <db>`` so the caller can classify all
+        BASE TABLE rows without one ``SHOW CREATE TABLE`` round-trip per object.
+        A SWITCH preamble scopes the listing to the target catalog, since the
+        pooled connection serving it may be on any session. Returns None when
+        the listing is unavailable (e.g. older Doris versions), signalling
+        callers to fall back to per-row probing.
+        """
+
+        try:
+            preamble = f"SWITCH {self._quote_identifier(catalog_name)}" if catalog_name else None
+            columns, rows = self._execute_keyed_tuples(
+                f"SHOW MATERIALIZED VIEWS FROM {self._quote_identifier(database_name)}",
+                preamble=preamble,
+            )
+            if not rows:
+                return set()
+            if "Name" not in columns:
+                return None
+            name_idx = columns.index("Name")
+            return {row[name_idx] for row in rows}
+        except Exception as e:
+            logger.debug(f"SHOW MATERIALIZED VIEWS unavailable for {database_name}, falling back to probing: {e}")
+            return None
+
     def _is_materialized_view(self, full_name: str) -> bool:
         """
         Determine whether a table name refers to a Doris materialized view.
 
         Doris reports materialized views as ``BASE TABLE`` in metadata. Attempt
-        ``SHOW CREATE TABLE`` and interpret the async materialized view error to
-        classify the object as a materialized view.
+        ``SHOW CREATE MATERIALIZED VIEW`` directly: success is both the
+        classification signal and the DDL, which is kept for the next
+        ``_show_create`` on the same object so the probe round trip is not
+        repeated just to re-fetch the definition.
+
+        A failed probe is only proof of "plain table" when the object is
+        otherwise reachable — a connection or permission error fails the exact
+        same way. Confirm with ``SHOW CREATE TABLE`` before classifying, and
+        raise when even that fails so callers do not record a wrong answer.
         """
 
         try:
-            super()._show_create(full_name, "TABLE")
+            ddl = super()._show_create(full_name, "MATERIALIZED VIEW")
+        except Exception:
+            try:
+                ddl = super()._show_create(full_name, "TABLE")
+            except Exception as e:
+                if _is_async_mv_hint(e):
+                    return True
+                raise
+
+            logger.debug(f"{full_name} is not a materialized view")
+            self._create_variant_cache[full_name] = "TABLE"
+            self._probe_ddl_cache[full_name] = ddl
             return False
-        except Exception as e:
-            if _is_async_mv_hint(e):
-                return True
 
-            raise
+        self._create_variant_cache[full_name] = "MATERIALIZED VIEW"
+        self._probe_ddl_cache[full_name] = ddl
+        return True
+
+    @override
+    def execute_ddl(self, sql: str) -> ExecuteSQLResult:
+        """Execute DDL and invalidate cached metadata, which may now be stale."""
+        result = super().execute_ddl(sql)
+        self._ttl_cache.clear()
+        self._mv_cache.clear()
+        self._create_variant_cache.clear()
+        self._probe_ddl_cache.clear()
+        self._metadata_cache.clear()
+        self._all_objects_cache.clear()
+        return result
 
     # ==================== Database Management ====================
 
     @override
+    @_cached_metadata
     def get_databases(self, catalog_name: str = "", include_sys: bool = False) -> List[str]:
         """Get list of databases in the catalog."""
         return super().get_databases(catalog_name, include_sys=include_sys)
@@ -387,17 +814,7 @@ class DorisConnector(MySQLConnector, CatalogSupportMixin, MaterializedViewSuppor
 
         Doris format: `catalog`.`database`.`table`
         """
-        catalog_name = self._resolved_catalog(catalog_name)
-
-        if catalog_name:
-            if database_name:
-                return f"`{catalog_name}`.`{database_name}`.`{table_name}`"
-            else:
-                return f"`{table_name}`"
-        else:
-            if database_name:
-                return f"`{database_name}`.`{table_name}`"
-            return f"`{table_name}`"
+        return _full_name_cached(self._resolved_catalog(catalog_name), database_name, table_name)
 
     @override
     def _sqlalchemy_schema(self, catalog_name: str = "", database_name: str = "", schema_name: str = "") -> str:
@@ -422,14 +839,22 @@ class DorisConnector(MySQLConnector, CatalogSupportMixin, MaterializedViewSuppor
         Doris may trigger PyMySQL struct.pack errors during cleanup,
         which we safely ignore.
         """
+        self._ttl_cache.clear()
+        self._mv_cache.clear()
+        self._create_variant_cache.clear()
+        self._probe_ddl_cache.clear()
+        self._identifier_cache.clear()
+        self._metadata_cache.clear()
+        self._all_objects_cache.clear()
+        if self._ddl_pool is not None:
+            self._ddl_pool.shutdown(wait=False)
+            self._ddl_pool = None
         try:
             super().close()
         except Exception as e:
             error_str = str(e)
 
-            pymysql_errors = ["struct.error", "struct.pack", "COMMAND.COM_QUIT", "required argument is not an integer"]
-
-            if any(err in error_str for err in pymysql_errors):
+            if _PYMYSQL_CLEANUP_RE.search(error_str):
                 logger.debug(f"Ignoring PyMySQL cleanup error: {e}")
 
                 if hasattr(self, "connection"):
@@ -225,23 +225,21 @@ def test_show_create_materialized_view(monkeypatch, connector: DorisConnector):
 
 
 def test_materialized_view_detection_filters(monkeypatch, connector: DorisConnector):
-    """Use SHOW CREATE TABLE errors to classify materialized views from BASE TABLE metadata."""
-
-    import pandas as pd
+    """Use SHOW CREATE probe results to classify materialized views from BASE TABLE metadata."""
 
     # Avoid real connections
-    monkeypatch.setattr(connector, "_before_metadata_query", lambda catalog_name="", database_name="": None)
     monkeypatch.setattr(connector, "connect", lambda: None)
 
     # Simulate BASE TABLE entries for a table and a materialized view
     monkeypatch.setattr(
         connector,
-        "_execute_pandas",
-        lambda sql: pd.DataFrame(
-            [["db", "fact_table"], ["db", "sales_mv"]], columns=["TABLE_SCHEMA", "TABLE_NAME"]
-        ),
+        "_execute_metadata_tuples",
+        lambda catalog_name, sql, params: [("db", "fact_table", "BASE TABLE"), ("db", "sales_mv", "BASE TABLE")],
     )
 
+    # Batched MV listing unavailable: force the per-object probe fallback
+    monkeypatch.setattr(connector, "_materialized_view_names", lambda catalog_name, database_name: None)
+
     # Only the second object is a materialized view
     monkeypatch.setattr(
         connector,
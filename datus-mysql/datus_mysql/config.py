@@ -20,3 +20,5 @@ class MySQLConfig(BaseModel):
     charset: str = Field(default="utf8mb4", description="Character set to use")
     autocommit: bool = Field(default=True, description="Enable autocommit mode")
     timeout_seconds: int = Field(default=30, description="Connection timeout in seconds")
+    pool_size: int = Field(default=10, description="Number of pooled connections to keep open")
+    max_overflow: int = Field(default=20, description="Extra connections allowed beyond pool_size")
@@ -2,11 +2,17 @@
 # Licensed under the Apache License, Version 2.0.
 # See http://www.apache.org/licenses/LICENSE-2.0 for details.
 
-from typing import Any, Dict, List, Optional, Set, Union, override
+import csv
+import io
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, override
 from urllib.parse import quote_plus
 
 from datus.schemas.base import TABLE_TYPE
-from datus.tools.db_tools.base import list_to_in_str
+from datus.schemas.node_models import ExecuteSQLResult
 from datus.utils.constants import DBType
 from datus.utils.exceptions import DatusException, ErrorCode
 from datus.utils.loggings import get_logger
@@ -18,6 +24,52 @@ from .config import MySQLConfig
 
 logger = get_logger(__name__)
 
+# Prefer the C-extension mysqlclient driver when installed: row decoding runs
+# in C instead of Python bytecode, which matters on large metadata fetches.
+# pymysql stays the pure-Python fallback and the declared dependency.
+try:
+    import MySQLdb  # noqa: F401
+
+    _MYSQL_DRIVER = "mysql+mysqldb"
+except ImportError:
+    _MYSQL_DRIVER = "mysql+pymysql"
+
+# Worker cap for concurrent SHOW CREATE fetches; bounded below the engine's
+# pool size so DDL retrieval cannot exhaust connections for other callers.
+_DDL_FETCH_WORKERS = 8
+
+# How long cached information_schema listings stay valid. Metadata changes on
+# the scale of minutes while agents re-list tables many times per session.
+_METADATA_CACHE_TTL_SECONDS = 60.0
+
+# Tables whose statistics report more rows than this are sampled with a
+# randomized predicate instead of a head-of-index LIMIT scan.
+_SAMPLE_RANDOM_SCAN_MIN_ROWS = 100_000
+
+# System databases excluded from listings; built once instead of per call.
+_SYS_DATABASES = frozenset({"sys", "information_schema", "performance_schema", "mysql"})
+
+
+@lru_cache(maxsize=4096)
+def _mk_full_name(database_name: str, table_name: str) -> str:
+    """Backtick-quoted full name with embedded backticks escaped; memoized."""
+    escaped_table = table_name.replace("`", "``")
+    if database_name:
+        escaped_db = database_name.replace("`", "``")
+        return f"`{escaped_db}`.`{escaped_table}`"
+    return f"`{escaped_table}`"
+
+
+# Column and primary-key lines inside SHOW CREATE TABLE output. Column lines
+# always start with a backtick-quoted name followed by the type expression.
+_CREATE_COLUMN_RE = re.compile(
+    r"^\s*`([^`]+)`\s+"
+    r"([a-zA-Z0-9_]+(?:\([^)]*\))?(?:\s+unsigned)?(?:\s+zerofill)?)"
+    r"(.*?),?\s*$"
+)
+_PRIMARY_KEY_RE = re.compile(r"^\s*PRIMARY KEY\s*\(([^)]*)\)", re.IGNORECASE)
+_DEFAULT_RE = re.compile(r"\bDEFAULT\s+(?:'([^']*)'|(\S+))", re.IGNORECASE)
+
 
 class TableMetadataNames(BaseModel):
     """Metadata configuration for different MySQL object types."""
@@ -46,11 +98,30 @@ METADATA_DICT: Dict[TABLE_TYPE, TableMetadataNames] = {
 }
 
 
+# Bound method reference so hot callers do a single C-level lookup.
+_METADATA_GET = METADATA_DICT.get
+
+# TABLE_TYPE filter clause and bind values per object type, built once at
+# import instead of per metadata query.
+_TYPE_FILTERS: Dict[TABLE_TYPE, tuple] = {}
+for _table_type, _config in METADATA_DICT.items():
+    if _config.table_types:
+        _placeholders = ", ".join(f":type_{i}" for i in range(len(_config.table_types)))
+        _TYPE_FILTERS[_table_type] = (
+            f" AND TABLE_TYPE IN ({_placeholders})",
+            {f"type_{i}": value for i, value in enumerate(_config.table_types)},
+        )
+    else:
+        _TYPE_FILTERS[_table_type] = ("", {})
+del _table_type, _config
+
+
 def _get_metadata_config(table_type: TABLE_TYPE) -> TableMetadataNames:
     """Get metadata configuration for given table type."""
-    if table_type not in METADATA_DICT:
+    config = _METADATA_GET(table_type)
+    if config is None:
         raise DatusException(ErrorCode.COMMON_FIELD_INVALID, f"Invalid table type '{table_type}'")
-    return METADATA_DICT[table_type]
+    return config
 
 
 class MySQLConnector(SQLAlchemyConnector):
@@ -81,19 +152,40 @@ class MySQLConnector(SQLAlchemyConnector):
 
         # Build connection string
         connection_string = (
-            f"mysql+pymysql://{self.username}:{encoded_password}@{self.host}:{self.port}/"
+            f"{_MYSQL_DRIVER}://{self.username}:{encoded_password}@{self.host}:{self.port}/"
             f"{database}?charset={config.charset}&autocommit={'true' if config.autocommit else 'false'}"
         )
 
-        super().__init__(connection_string, dialect=DBType.MYSQL)
+        super().__init__(
+            connection_string,
+            dialect=DBType.MYSQL,
+            timeout_seconds=config.timeout_seconds,
+            pool_size=config.pool_size,
+            max_overflow=config.max_overflow,
+        )
         self.database_name = database
 
+        # Shared bounded pool for concurrent DDL fetches, created on first use.
+        self._ddl_pool: Optional[ThreadPoolExecutor] = None
+
+        # TTL cache for _get_metadata results keyed by (table_type, database);
+        # invalidated on context switch and close.
+        self._metadata_cache: Dict[Tuple[str, str, str], Tuple[float, List[Dict[str, str]]]] = {}
+
+        # DDL text recently fetched via SHOW CREATE, keyed by full name, so
+        # get_schema can answer from the parsed DDL without a DESCRIBE trip.
+        self._ddl_text_cache: Dict[str, Tuple[float, str]] = {}
+
+        # Memoized identifier strings; identifier() is pure string formatting
+        # but sits inside the per-row metadata loops.
+        self._identifier_cache: Dict[Tuple[str, str, str], str] = {}
+
     # ==================== System Resources ====================
 
     @override
     def _sys_databases(self) -> Set[str]:
         """System databases to filter out."""
-        return {"sys", "information_schema", "performance_schema", "mysql"}
+        return _SYS_DATABASES
 
     @override
     def _sys_schemas(self) -> Set[str]:
@@ -130,41 +222,62 @@ class MySQLConnector(SQLAlchemyConnector):
         self.connect()
         database_name = database_name or self.database_name
 
+        # The session catalog is part of the key: subclasses with catalog
+        # support (StarRocks, Doris) serve different objects for the same
+        # database name depending on the active catalog.
+        cache_key = (table_type, self.catalog_name or "", database_name)
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _METADATA_CACHE_TTL_SECONDS:
+            return [dict(entry) for entry in cached[1]]
+
         # Build WHERE clause
+        params: Dict[str, Any] = {}
         if database_name:
-            where = f"TABLE_SCHEMA = '{database_name}'"
+            where = "TABLE_SCHEMA = :table_schema"
+            params["table_schema"] = database_name
         else:
-            where = f"{list_to_in_str('TABLE_SCHEMA not in', list(self._sys_databases()))}"
+            # SHOW DATABASES is a cheap dictionary read; resolving the system
+            # filter in Python and sending a sargable IN list lets the server
+            # answer from the data dictionary instead of scanning every
+            # database to evaluate a NOT IN predicate.
+            databases = sorted({row[0] for row in self._execute_tuples("SHOW DATABASES")} - self._sys_databases())
+            if not databases:
+                self._metadata_cache[cache_key] = (time.monotonic(), [])
+                return []
+            placeholders = ", ".join(f":db_{i}" for i in range(len(databases)))
+            where = f"TABLE_SCHEMA IN ({placeholders})"
+            params.update({f"db_{i}": name for i, name in enumerate(databases)})
 
         # Get metadata configuration
         metadata_config = _get_metadata_config(table_type)
 
-        # Build and execute query
-        type_filter = list_to_in_str("and TABLE_TYPE in ", metadata_config.table_types)
+        # Build and execute query; the precomputed bound type filter keeps the
+        # statement text stable across calls so the server can reuse its plan.
+        type_filter, type_params = _TYPE_FILTERS[table_type]
+        params.update(type_params)
         query = (
             f"SELECT TABLE_SCHEMA, TABLE_NAME "
             f"FROM information_schema.{metadata_config.info_table} "
-            f"WHERE {where} {type_filter}"
+            f"WHERE {where}{type_filter}"
         )
 
-        query_result = self._execute_pandas(query)
-
-        # Format results
-        result = []
-        for i in range(len(query_result)):
-            db_name = query_result["TABLE_SCHEMA"][i]
-            tb_name = query_result["TABLE_NAME"][i]
-            result.append(
-                {
-                    "identifier": self.identifier(database_name=db_name, table_name=tb_name),
-                    "catalog_name": "",
-                    "schema_name": "",
-                    "database_name": db_name,
-                    "table_name": tb_name,
-                    "table_type": table_type,
-                }
-            )
-        return result
+        # Raw tuples: a DataFrame plus per-cell Series indexing is pure
+        # overhead for a two-column metadata listing.
+        result = [
+            {
+                "identifier": self._identifier_for("", db_name, tb_name),
+                "catalog_name": "",
+                "schema_name": "",
+                "database_name": db_name,
+                "table_name": tb_name,
+                "table_type": table_type,
+            }
+            for db_name, tb_name in self._execute_tuples(query, params)
+        ]
+        self._metadata_cache[cache_key] = (time.monotonic(), result)
+        # Hand out copies so callers mutating entries in place (StarRocks
+        # rewrites catalog_name and identifier) cannot poison the cache.
+        return [dict(entry) for entry in result]
 
     def _show_create(self, full_name: str, create_type: str) -> str:
         """
@@ -180,9 +293,57 @@ class MySQLConnector(SQLAlchemyConnector):
         sql = f"SHOW CREATE {create_type} {full_name}"
         ddl_result = self._execute_pandas(sql)
         if not ddl_result.empty and len(ddl_result.columns) >= 2:
-            return str(ddl_result.iloc[0, 1])
+            ddl = str(ddl_result.iloc[0, 1])
+            self._ddl_text_cache[full_name] = (time.monotonic(), ddl)
+            return ddl
         return f"-- DDL not available for {full_name}"
 
+    @staticmethod
+    def _parse_create_table(ddl: str) -> List[Dict[str, Any]]:
+        """
+        Derive column information from SHOW CREATE TABLE output.
+
+        Covers the same fields DESCRIBE reports (name, type, nullability,
+        default, primary-key membership) so callers holding the DDL can skip a
+        round trip. Returns an empty list when nothing parseable is found.
+        """
+        columns: List[Dict[str, Any]] = []
+        pk_names: Set[str] = set()
+
+        for line in ddl.splitlines()[1:]:
+            pk_match = _PRIMARY_KEY_RE.match(line)
+            if pk_match:
+                pk_names.update(name.strip(" `") for name in pk_match.group(1).split(","))
+                continue
+            if not line.lstrip().startswith("`"):
+                continue
+            col_match = _CREATE_COLUMN_RE.match(line)
+            if not col_match:
+                continue
+            name, col_type, rest = col_match.groups()
+            default_match = _DEFAULT_RE.search(rest)
+            default_value = None
+            if default_match:
+                default_value = default_match.group(1) if default_match.group(1) is not None else default_match.group(2)
+                if isinstance(default_value, str) and default_value.upper() == "NULL":
+                    default_value = None
+            columns.append(
+                {
+                    "cid": len(columns),
+                    "name": name,
+                    "type": col_type,
+                    "nullable": "NOT NULL" not in rest.upper(),
+                    "default_value": default_value,
+                    "pk": False,
+                }
+            )
+
+        if pk_names:
+            for column in columns:
+                if column["name"] in pk_names:
+                    column["pk"] = True
+        return columns
+
     def _get_objects_with_ddl(
         self,
         table_type: TABLE_TYPE = "table",
@@ -202,32 +363,61 @@ class MySQLConnector(SQLAlchemyConnector):
         Returns:
             List of metadata dictionaries with DDL
         """
-        result = []
         filter_tables = self._reset_filter_tables(tables, catalog_name, database_name)
         metadata_config = _get_metadata_config(table_type)
 
+        surviving = []
         for meta in self._get_metadata(table_type, catalog_name, database_name):
             full_name = self.full_name(database_name=meta["database_name"], table_name=meta["table_name"])
-
-            # Skip if not in filter list
             if filter_tables and full_name not in filter_tables:
                 continue
+            surviving.append((meta, full_name))
+
+        # SHOW CREATE is one round trip per object; fetching them concurrently
+        # over the engine's pooled connections turns N sequential round trips
+        # into ceil(N / workers) batches.
+        ddls = self._ddl_executor().map(
+            lambda full_name: self._show_create_safe(full_name, metadata_config.show_create_table),
+            [full_name for _, full_name in surviving],
+        )
+        return [{**meta, "definition": ddl} for (meta, _), ddl in zip(surviving, ddls)]
+
+    def _ddl_executor(self) -> ThreadPoolExecutor:
+        """Return the shared DDL fetch pool, creating it on first use."""
+        if self._ddl_pool is None:
+            self._ddl_pool = ThreadPoolExecutor(max_workers=_DDL_FETCH_WORKERS, thread_name_prefix="mysql-ddl")
+        return self._ddl_pool
+
+    def _show_create_safe(self, full_name: str, create_type: str) -> str:
+        """Fetch DDL via _show_create, returning a placeholder comment on failure."""
+        try:
+            return self._show_create(full_name, create_type)
+        except Exception as e:
+            logger.warning(f"Could not get DDL for {full_name}: {e}")
+            return f"-- DDL not available for {full_name}"
 
-            # Get DDL
-            try:
-                ddl = self._show_create(full_name, metadata_config.show_create_table)
-            except Exception as e:
-                logger.warning(f"Could not get DDL for {full_name}: {e}")
-                ddl = f"-- DDL not available for {meta['table_name']}"
-
-            meta["definition"] = ddl
-            result.append(meta)
-
-        return result
+    @override
+    def close(self):
+        """Close the connection pool, releasing the DDL fetch pool first."""
+        self._metadata_cache.clear()
+        self._ddl_text_cache.clear()
+        self._identifier_cache.clear()
+        if self._ddl_pool is not None:
+            self._ddl_pool.shutdown(wait=False)
+            self._ddl_pool = None
+        super().close()
 
     @override
     def get_tables(self, catalog_name: str = "", database_name: str = "", schema_name: str = "") -> List[str]:
         """Get list of table names."""
+        database_name = database_name or self.database_name
+        if database_name:
+            # SHOW FULL TABLES answers straight from the data dictionary; the
+            # information_schema path is only needed for cross-database scans.
+            rows = self._execute_tuples(
+                f"SHOW FULL TABLES FROM {self._quote_identifier(database_name)} WHERE Table_type = 'BASE TABLE'"
+            )
+            return [row[0] for row in rows]
         return [meta["table_name"] for meta in self._get_metadata("table", catalog_name, database_name)]
 
     @override
@@ -266,23 +456,37 @@ class MySQLConnector(SQLAlchemyConnector):
         database_name = database_name or self.database_name
         full_table_name = self.full_name(database_name=database_name, table_name=table_name)
 
-        # Use DESCRIBE to get schema
-        sql = f"DESCRIBE {full_table_name}"
-        query_result = self._execute_pandas(sql)
+        # If the DDL was fetched recently (e.g. by get_tables_with_ddl), parse
+        # the column list out of it instead of issuing another round trip.
+        cached_ddl = self._ddl_text_cache.get(full_table_name)
+        if cached_ddl is not None and time.monotonic() - cached_ddl[0] < _METADATA_CACHE_TTL_SECONDS:
+            parsed = self._parse_create_table(cached_ddl[1])
+            if parsed:
+                return parsed
+
+        # Use DESCRIBE to get schema; raw tuples with a column-name lookup
+        # avoid the DataFrame build for what is typically a handful of rows.
+        columns, rows = self._execute_keyed_tuples(f"DESCRIBE {full_table_name}")
+        if not rows:
+            return []
 
-        result = []
-        for i in range(len(query_result)):
-            result.append(
-                {
-                    "cid": i,
-                    "name": query_result["Field"][i],
-                    "type": query_result["Type"][i],
-                    "nullable": query_result["Null"][i] == "YES",
-                    "default_value": query_result["Default"][i],
-                    "pk": query_result["Key"][i] == "PRI",
-                }
-            )
-        return result
+        field_idx = columns.index("Field")
+        type_idx = columns.index("Type")
+        null_idx = columns.index("Null")
+        key_idx = columns.index("Key")
+        default_idx = columns.index("Default")
+
+        return [
+            {
+                "cid": i,
+                "name": row[field_idx],
+                "type": row[type_idx],
+                "nullable": row[null_idx] == "YES",
+                "default_value": row[default_idx],
+                "pk": row[key_idx] == "PRI",
+            }
+            for i, row in enumerate(rows)
+        ]
 
     # ==================== Database/Schema Management ====================
 
@@ -303,10 +507,20 @@ class MySQLConnector(SQLAlchemyConnector):
         """Get schema name for SQLAlchemy Inspector (database name in MySQL)."""
         return database_name or self.database_name
 
+    @override
+    def execute_ddl(self, sql: str) -> ExecuteSQLResult:
+        """Execute DDL and drop cached listings and DDL text, which may now be stale."""
+        result = super().execute_ddl(sql)
+        self._metadata_cache.clear()
+        self._ddl_text_cache.clear()
+        return result
+
     @override
     def do_switch_context(self, catalog_name: str = "", database_name: str = "", schema_name: str = ""):
         """Switch database context using USE statement."""
         if database_name:
+            self._metadata_cache.clear()
+            self._ddl_text_cache.clear()
             self.connection.execute(text(f"USE {self._quote_identifier(database_name)}"))
 
     # ==================== Sample Data ====================
@@ -334,49 +548,111 @@ class MySQLConnector(SQLAlchemyConnector):
 
         self.connect()
         database_name = database_name or self.database_name
-        result = []
 
-        # If specific tables provided, query those
+        # If specific tables provided, query those; otherwise fall back to the
+        # metadata listing. Either way the per-table SELECTs are one round trip
+        # each, so they run concurrently over the engine's pooled connections.
         if tables:
-            for table_name in tables:
-                full_name = self.full_name(
-                    catalog_name=catalog_name, database_name=database_name, table_name=table_name
+            entries = [
+                (
+                    {
+                        "identifier": self._identifier_for(catalog_name, database_name, table_name),
+                        "catalog_name": catalog_name,
+                        "database_name": database_name,
+                        "schema_name": "",
+                        "table_name": table_name,
+                    },
+                    self.full_name(catalog_name=catalog_name, database_name=database_name, table_name=table_name),
+                    (database_name, table_name),
                 )
-                sql = f"SELECT * FROM {full_name} LIMIT {top_n}"
-                df = self._execute_pandas(sql)
-                if not df.empty:
-                    result.append(
-                        {
-                            "identifier": self.identifier(
-                                catalog_name=catalog_name, database_name=database_name, table_name=table_name
-                            ),
-                            "catalog_name": catalog_name,
-                            "database_name": database_name,
-                            "schema_name": "",
-                            "table_name": table_name,
-                            "sample_rows": df.to_csv(index=False),
-                        }
-                    )
-            return result
-
-        # Otherwise get metadata and query all tables
-        metadata = self._get_metadata(table_type, "", database_name)
-        for meta in metadata:
-            full_name = self.full_name(database_name=meta["database_name"], table_name=meta["table_name"])
-            sql = f"SELECT * FROM {full_name} LIMIT {top_n}"
-            df = self._execute_pandas(sql)
-            if not df.empty:
-                result.append(
+                for table_name in tables
+            ]
+        else:
+            entries = [
+                (
                     {
                         "identifier": meta["identifier"],
                         "catalog_name": meta["catalog_name"],
                         "database_name": meta["database_name"],
                         "schema_name": "",
                         "table_name": meta["table_name"],
-                        "sample_rows": df.to_csv(index=False),
-                    }
+                    },
+                    self.full_name(database_name=meta["database_name"], table_name=meta["table_name"]),
+                    (meta["database_name"], meta["table_name"]),
                 )
-        return result
+                for meta in self._get_metadata(table_type, "", database_name)
+            ]
+
+        row_counts = self._approx_row_counts([key for _, _, key in entries if key[0]])
+        samples = self._ddl_executor().map(
+            lambda args: self._fetch_sample_csv(args[0], top_n, row_counts.get(args[1], 0)),
+            [(full_name, key) for _, full_name, key in entries],
+        )
+        return [
+            {**entry, "sample_rows": sample} for (entry, _, _), sample in zip(entries, samples) if sample is not None
+        ]
+
+    def _identifier_for(self, catalog_name: str, database_name: str, table_name: str) -> str:
+        """Memoized identifier construction for the hot metadata loops."""
+        key = (catalog_name, database_name, table_name)
+        ident = self._identifier_cache.get(key)
+        if ident is None:
+            ident = self.identifier(catalog_name=catalog_name, database_name=database_name, table_name=table_name)
+            self._identifier_cache[key] = ident
+        return ident
+
+    def _approx_row_counts(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], int]:
+        """
+        Approximate row counts from table statistics for (database, table) pairs.
+
+        One information_schema query for the whole batch; statistics are stale
+        but good enough to decide how to sample. Failures degrade to empty,
+        which keeps samplers on the plain LIMIT path.
+        """
+        if not keys:
+            return {}
+
+        params: Dict[str, Any] = {}
+        clauses = []
+        for i, (db_name, tb_name) in enumerate(keys):
+            clauses.append(f"(TABLE_SCHEMA = :s_{i} AND TABLE_NAME = :t_{i})")
+            params[f"s_{i}"] = db_name
+            params[f"t_{i}"] = tb_name
+        query = "SELECT TABLE_SCHEMA, TABLE_NAME, TABLE_ROWS FROM information_schema.TABLES WHERE " + " OR ".join(
+            clauses
+        )
+
+        try:
+            return {(db, tb): int(n or 0) for db, tb, n in self._execute_tuples(query, params)}
+        except Exception as e:
+            logger.debug(f"Could not read approximate row counts: {e}")
+            return {}
+
+    def _fetch_sample_csv(self, full_name: str, top_n: int, approx_rows: int = 0) -> Optional[str]:
+        """Fetch up to ``top_n`` rows from a table as CSV, or None when empty."""
+        if approx_rows > _SAMPLE_RANDOM_SCAN_MIN_ROWS:
+            # A plain LIMIT reads only the head of the clustered index, which
+            # is both unrepresentative and cold-I/O-bound on big tables. A
+            # randomized predicate spreads the reads; the hint lets InnoDB
+            # parallelize the scan on 8.0.14+ and is ignored elsewhere.
+            fraction = min(1.0, (top_n * 100) / approx_rows)
+            sql = (
+                f"SELECT /*+ SET_VAR(innodb_parallel_read_threads=4) */ * FROM {full_name} "
+                f"WHERE RAND() < {fraction:.8f} LIMIT {top_n}"
+            )
+        else:
+            sql = f"SELECT * FROM {full_name} LIMIT {top_n}"
+        columns, rows = self._execute_keyed_tuples(sql)
+        if not rows:
+            return None
+
+        # stdlib csv over raw tuples; building a DataFrame just to serialize a
+        # handful of rows pays dtype inference and per-cell conversion costs.
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerows(rows)
+        return buffer.getvalue()
 
     # ==================== Utility Methods ====================
 
@@ -385,9 +661,7 @@ class MySQLConnector(SQLAlchemyConnector):
         self, catalog_name: str = "", database_name: str = "", schema_name: str = "", table_name: str = ""
     ) -> str:
         """Build fully-qualified table name."""
-        if database_name:
-            return f"`{database_name}`.`{table_name}`"
-        return f"`{table_name}`"
+        return _mk_full_name(database_name, table_name)
 
     @override
     def _reset_filter_tables(
@@ -4,7 +4,9 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Optional
+from urllib.parse import quote_plus
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -12,7 +14,9 @@ from pydantic import BaseModel, ConfigDict, Field, model_validator
 class OracleConfig(BaseModel):
     """Configuration options for Oracle connections."""
 
-    model_config = ConfigDict(extra="forbid")
+    # frozen makes instances hashable so connectors and registries can use
+    # configs as cache keys; nothing mutates a config after construction.
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     host: str = Field(..., description="Oracle server host")
     port: int = Field(default=1521, ge=1, le=65535, description="Oracle listener port")
@@ -23,6 +27,8 @@ class OracleConfig(BaseModel):
     schema_name: Optional[str] = Field(default=None, description="Default schema (defaults to username)")
     client_lib_dir: Optional[str] = Field(default=None, description="Oracle Instant Client directory for thick mode")
     timeout_seconds: int = Field(default=30, ge=1, description="Connection timeout in seconds")
+    pool_size: int = Field(default=10, ge=1, description="Number of pooled connections to keep open")
+    max_overflow: int = Field(default=20, ge=0, description="Extra connections allowed beyond pool_size")
 
     @model_validator(mode="after")
     def _validate_identifier(self) -> "OracleConfig":
@@ -30,3 +36,12 @@ class OracleConfig(BaseModel):
         if not self.database and not self.sid:
             raise ValueError("Either database or sid must be provided")
         return self
+
+    @cached_property
+    def connection_string(self) -> str:
+        """SQLAlchemy URL derived from this config; built once per instance."""
+        encoded_password = quote_plus(self.password) if self.password else ""
+        base = f"oracle+oracledb://{self.username}:{encoded_password}@{self.host}:{self.port}"
+        if self.database:
+            return f"{base}/?service_name={quote_plus(self.database)}"
+        return f"{base}/?sid={quote_plus(self.sid)}"
@@ -4,9 +4,13 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Set, Union, override
-from urllib.parse import quote_plus
-
+import csv
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, override
 import oracledb
 from datus.schemas.base import TABLE_TYPE
 from datus.utils.constants import DBType
@@ -19,7 +23,115 @@ from .config import OracleConfig
 
 logger = get_logger(__name__)
 
-
+# init_oracle_client is process-global; attempt it once per process rather
+# than per connector construction.
+_thick_mode_lock = threading.Lock()
+_thick_mode_checked = False
+
+# Oracle rejects IN/expression lists longer than 1000 entries (ORA-01795), and
+# statement parse time grows super-linearly with bind count; batched queries
+# stay below this cap.
+_IN_LIST_BATCH_SIZE = 1000
+
+# Worker cap for concurrent per-table fetches (samples, DDL); bounded below
+# the engine's pool size so they cannot exhaust connections for other callers.
+_FETCH_POOL_WORKERS = 8
+
+# Rows fetched per network round trip. The driver defaults (arraysize=100,
+# prefetchrows=2) make wide ALL_TAB_COLUMNS scans round-trip-bound; prefetch
+# is one higher than arraysize so the end-of-result marker needs no extra trip.
+_FETCH_ARRAYSIZE = 5000
+
+# Repeated DDL asks for the same object within this window are served from
+# memory instead of re-running DBMS_METADATA and re-reading the CLOB.
+_DDL_CACHE_TTL_SECONDS = 600.0
+
+
+# Default system schemas excluded from object listings; frozen once at import.
+_SYS_SCHEMAS: frozenset[str] = frozenset(
+    {
+        "ANONYMOUS",
+        "APEX_PUBLIC_USER",
+        "APPQOSSYS",
+        "AUDSYS",
+        "CTXSYS",
+        "DBSNMP",
+        "DIP",
+        "DVF",
+        "DVSYS",
+        "FLOWS_FILES",
+        "GSMADMIN_INTERNAL",
+        "LBACSYS",
+        "MDSYS",
+        "OLAPSYS",
+        "ORDPLUGINS",
+        "ORDSYS",
+        "OUTLN",
+        "REMOTE_SCHEDULER_AGENT",
+        "SI_INFORMTN_SCHEMA",
+        "SYS",
+        "SYSBACKUP",
+        "SYSDG",
+        "SYSKM",
+        "SYSTEM",
+        "WMSYS",
+        "XDB",
+    }
+)
+
+# Sorted once so the NOT IN bind list is stable across queries.
+_SYS_SCHEMAS_SORTED: tuple[str, ...] = tuple(sorted(_SYS_SCHEMAS))
+
+# System-schema exclusion clause and its bind values, built once at import.
+_SYS_NOT_IN_CLAUSE = "OWNER NOT IN ({})".format(", ".join(f":sys_{i}" for i in range(len(_SYS_SCHEMAS_SORTED))))
+_SYS_PARAMS: Dict[str, str] = {f"sys_{i}": name for i, name in enumerate(_SYS_SCHEMAS_SORTED)}
+
+# ALL_* source view and name column per object type.
+# DBMS_METADATA object type per catalog table_type; GET_DDL wants underscores
+# in place of spaces, which _fetch_object_ddl and _fetch_ddl_batch apply.
+_DDL_OBJECT_TYPE = {"table": "TABLE", "view": "VIEW", "mv": "MATERIALIZED VIEW"}
+
+_META_MAP = {
+    "table": ("ALL_TABLES", "TABLE_NAME"),
+    "view": ("ALL_VIEWS", "VIEW_NAME"),
+    "mv": ("ALL_MVIEWS", "MVIEW_NAME"),
+}
+
+# Statements compiled once at import; per-call text() construction re-parses
+# the string on the Python side and defeats SQLAlchemy's compiled cache.
+_SQL_DDL = text("SELECT DBMS_METADATA.GET_DDL(:object_type, :name, :owner) FROM dual")
+_SQL_TABLE_COLUMNS = text(
+    """
+    SELECT
+        cols.COLUMN_ID,
+        cols.COLUMN_NAME,
+        cols.DATA_TYPE,
+        cols.DATA_LENGTH,
+        cols.DATA_PRECISION,
+        cols.DATA_SCALE,
+        cols.NULLABLE,
+        cols.DATA_DEFAULT,
+        pk.COLUMN_NAME AS PK_COLUMN
+    FROM ALL_TAB_COLUMNS cols
+    LEFT JOIN (
+        SELECT acc.COLUMN_NAME
+        FROM ALL_CONSTRAINTS ac
+        JOIN ALL_CONS_COLUMNS acc
+            ON ac.CONSTRAINT_NAME = acc.CONSTRAINT_NAME
+           AND ac.OWNER = acc.OWNER
+        WHERE ac.CONSTRAINT_TYPE = 'P'
+          AND ac.OWNER = :owner
+          AND ac.TABLE_NAME = :table_name
+    ) pk
+    ON cols.COLUMN_NAME = pk.COLUMN_NAME
+    WHERE cols.OWNER = :owner
+      AND cols.TABLE_NAME = :table_name
+    ORDER BY cols.COLUMN_ID
+    """
+)
+
+
+@lru_cache(maxsize=4096)
 def _quote_identifier(identifier: str) -> str:
     """Double-quote an identifier, escaping internal quotes."""
     escaped = identifier.replace('"', '""')
@@ -36,83 +148,82 @@ class OracleConnector(SQLAlchemyConnector):
             raise TypeError(f"config must be OracleConfig or dict, got {type(config)}")
 
         self.config = config
+
+        # Driver-wide bulk-fetch defaults; new connections pick these up.
+        oracledb.defaults.arraysize = _FETCH_ARRAYSIZE
+        oracledb.defaults.prefetchrows = _FETCH_ARRAYSIZE + 1
+        # Return CLOBs (DBMS_METADATA DDL text) as str in the same round trip
+        # instead of LOB locators that cost extra trips per .read().
+        oracledb.defaults.fetch_lobs = False
+
         self._ensure_thick_mode()
-        connection_string = self._build_connection_string(config)
 
-        super().__init__(connection_string, dialect=DBType.ORACLE, timeout_seconds=config.timeout_seconds)
+        super().__init__(
+            config.connection_string,
+            dialect=DBType.ORACLE,
+            timeout_seconds=config.timeout_seconds,
+            pool_size=config.pool_size,
+            max_overflow=config.max_overflow,
+        )
         self.database_name = config.database or config.sid or ""
-        self.schema_name = (config.schema_name or config.username).upper()
+        # Normalized once; Oracle dictionary views expect upper-case owners.
+        self._default_owner = (config.schema_name or config.username).upper()
+        self.schema_name = self._default_owner
         self.catalog_name = ""
 
+        # Introspection caches validated by a cheap MAX(LAST_DDL_TIME) probe:
+        # a one-row round trip replaces the full ALL_TAB_COLUMNS / ALL_* scans
+        # when nothing in the schema has changed. Cleared on context switch.
+        self._schema_cache: Dict[tuple, tuple] = {}
+        self._objects_cache: Dict[tuple, tuple] = {}
+
+        # Per-object DDL text keyed by (object_type, owner, name), TTL-bound.
+        self._object_ddl_cache: Dict[tuple, Tuple[float, str]] = {}
+
+        # Shared bounded pool for concurrent per-table fetches, lazily created.
+        self._fetch_pool: Optional[ThreadPoolExecutor] = None
+
     def _ensure_thick_mode(self):
         """
         Initialize Oracle client in thick mode if the driver is running in thin mode.
 
         Oracle client libraries must be installed locally; we fail soft to allow environments
-        without Instant Client to continue using thin mode.
+        without Instant Client to continue using thin mode. The outcome is
+        process-global, so only the first connector in the process does the work.
         """
-        try:
-            is_thin = getattr(oracledb, "is_thin_mode", lambda: False)()
-        except Exception:
+        global _thick_mode_checked
+        if _thick_mode_checked:
             return
 
-        if not is_thin:
-            return
+        with _thick_mode_lock:
+            if _thick_mode_checked:
+                return
+            _thick_mode_checked = True
 
-        init_kwargs: Dict[str, Any] = {}
-        if self.config.client_lib_dir:
-            init_kwargs["lib_dir"] = self.config.client_lib_dir
+            try:
+                is_thin = getattr(oracledb, "is_thin_mode", lambda: False)()
+            except Exception:
+                return
 
-        try:
-            oracledb.init_oracle_client(**init_kwargs)
-            logger.info("Initialized Oracle thick client mode")
-        except Exception as exc:
-            logger.warning(f"Failed to initialize Oracle thick client, continuing in thin mode: {exc}")
+            if not is_thin:
+                return
 
-    @staticmethod
-    def _build_connection_string(config: OracleConfig) -> str:
-        """Build a SQLAlchemy Oracle connection string."""
-        encoded_password = quote_plus(config.password) if config.password else ""
-        auth = f"{config.username}:{encoded_password}@"
-        base = f"oracle+oracledb://{auth}{config.host}:{config.port}"
+            init_kwargs: Dict[str, Any] = {}
+            if self.config.client_lib_dir:
+                init_kwargs["lib_dir"] = self.config.client_lib_dir
 
-        if config.database:
-            return f"{base}/?service_name={quote_plus(config.database)}"
-        return f"{base}/?sid={quote_plus(config.sid)}"
+            try:
+                oracledb.init_oracle_client(**init_kwargs)
+                logger.info("Initialized Oracle thick client mode")
+            except Exception as exc:
+                logger.warning(f"Failed to initialize Oracle thick client, continuing in thin mode: {exc}")
 
     # ==================== System Resources ====================
 
     @override
     def _sys_schemas(self) -> Set[str]:
         """System schemas to filter out."""
-        return {
-            "ANONYMOUS",
-            "APEX_PUBLIC_USER",
-            "APPQOSSYS",
-            "AUDSYS",
-            "CTXSYS",
-            "DBSNMP",
-            "DIP",
-            "DVF",
-            "DVSYS",
-            "FLOWS_FILES",
-            "GSMADMIN_INTERNAL",
-            "LBACSYS",
-            "MDSYS",
-            "OLAPSYS",
-            "ORDPLUGINS",
-            "ORDSYS",
-            "OUTLN",
-            "REMOTE_SCHEDULER_AGENT",
-            "SI_INFORMTN_SCHEMA",
-            "SYS",
-            "SYSBACKUP",
-            "SYSDG",
-            "SYSKM",
-            "SYSTEM",
-            "WMSYS",
-            "XDB",
-        }
+        return _SYS_SCHEMAS
 
     # ==================== Context Management ====================
 
@@ -127,6 +238,9 @@ class OracleConnector(SQLAlchemyConnector):
         with self.connection.begin():
             self.connection.execute(text(f'ALTER SESSION SET CURRENT_SCHEMA = "{target_schema}"'))
         self.schema_name = target_schema
+        self._schema_cache.clear()
+        self._objects_cache.clear()
+        self._object_ddl_cache.clear()
 
     # ==================== Metadata Helpers ====================
 
@@ -135,13 +249,41 @@ class OracleConnector(SQLAlchemyConnector):
         self, catalog_name: str = "", database_name: str = "", schema_name: str = ""
     ) -> Optional[str]:
         """Return schema name for SQLAlchemy inspector."""
-        return (schema_name or self.schema_name or self.config.username).upper()
+        return self._resolve_owner(schema_name)
 
     @override
     def get_databases(self, catalog_name: str = "", include_sys: bool = False) -> List[str]:
         """Oracle uses a single database instance; return the configured service or SID."""
         return [self.database_name] if self.database_name else []
 
+    def _resolve_owner(self, schema_name: str = "") -> str:
+        """Return the effective upper-cased owner for dictionary queries."""
+        if schema_name:
+            return schema_name.upper()
+        return self.schema_name or self._default_owner
+
+    def _last_ddl_time(self, owner: str, object_name: str = "") -> Optional[Any]:
+        """
+        Version probe for cached introspection results.
+
+        Returns MAX(LAST_DDL_TIME) for one object or a whole owner, or None
+        when the probe fails — callers treat None as "cannot validate" and
+        re-fetch.
+        """
+        sql = "SELECT MAX(LAST_DDL_TIME) FROM ALL_OBJECTS WHERE OWNER = :owner"
+        params: Dict[str, Any] = {"owner": owner}
+        if object_name:
+            sql += " AND OBJECT_NAME = :object_name"
+            params["object_name"] = object_name
+
+        try:
+            self.connect()
+            row = self.connection.execute(text(sql), params).fetchone()
+            return row[0] if row else None
+        except Exception as exc:
+            logger.debug(f"LAST_DDL_TIME probe failed for {owner}: {exc}")
+            return None
+
     # ==================== Object Metadata ====================
 
     def _list_objects(
@@ -153,48 +295,69 @@ class OracleConnector(SQLAlchemyConnector):
         tables: Optional[List[str]] = None,
     ) -> List[Dict[str, str]]:
         """List tables/views/materialized views from ALL_* views."""
-        if table_type == "full":
-            combined: List[Dict[str, str]] = []
-            for sub_type in ("table", "view", "mv"):
-                combined.extend(self._list_objects(sub_type, catalog_name, database_name, schema_name, tables))
-            return combined
         table_type = "mv" if table_type == "materialized_view" else table_type
-        meta_map = {
-            "table": ("ALL_TABLES", "TABLE_NAME"),
-            "view": ("ALL_VIEWS", "VIEW_NAME"),
-            "mv": ("ALL_MVIEWS", "MVIEW_NAME"),
-        }
-        if table_type not in meta_map:
+        if table_type == "full":
+            # One UNION ALL round trip instead of three separate listings; the
+            # literal type label per arm carries the object kind back with the row.
+            sources = [(source, column, kind) for kind, (source, column) in _META_MAP.items()]
+        elif table_type in _META_MAP:
+            source_table, name_column = _META_MAP[table_type]
+            sources = [(source_table, name_column, table_type)]
+        else:
             return []
 
-        source_table, name_column = meta_map[table_type]
-        schema = (schema_name or self.schema_name or self.config.username).upper()
+        schema = self._resolve_owner(schema_name)
+
+        # Unfiltered single-schema listings are cached and revalidated with a
+        # LAST_DDL_TIME probe; filtered or cross-schema calls go straight out.
+        cache_key = (table_type, schema) if schema and not tables else None
+        if cache_key is not None:
+            cached = self._objects_cache.get(cache_key)
+            if cached is not None:
+                stamp = self._last_ddl_time(schema)
+                if stamp is not None and stamp == cached[0]:
+                    return [dict(entry) for entry in cached[1]]
+
+        def build_sql(name_filter: str) -> str:
+            arms = []
+            for source, column, kind in sources:
+                arm = f"SELECT OWNER, {column} AS OBJECT_NAME, '{kind}' AS OBJECT_KIND FROM {source} WHERE 1=1"
+                if schema:
+                    arm += " AND OWNER = :owner"
+                else:
+                    arm += f" AND {_SYS_NOT_IN_CLAUSE}"
+                if name_filter:
+                    arm += f" AND {column} IN ({name_filter})"
+                arms.append(arm)
+            return " UNION ALL ".join(arms)
 
-        sql = f"SELECT OWNER, {name_column} AS OBJECT_NAME FROM {source_table} WHERE 1=1"
         params: Dict[str, Any] = {}
-
         if schema:
-            sql += " AND OWNER = :owner"
             params["owner"] = schema
         else:
-            sys_schemas = ", ".join(f":sys_{i}" for i in range(len(self._sys_schemas())))
-            sql += f" AND OWNER NOT IN ({sys_schemas})"
-            for i, name in enumerate(sorted(self._sys_schemas())):
-                params[f"sys_{i}"] = name
+            params.update(_SYS_PARAMS)
 
+        self.connect()
         if tables:
-            placeholders = ", ".join(f":tbl_{idx}" for idx in range(len(tables)))
-            sql += f" AND {name_column} IN ({placeholders})"
-            for idx, table_name in enumerate(tables):
-                params[f"tbl_{idx}"] = table_name.upper()
-
-        sql += f" ORDER BY OWNER, {name_column}"
+            # Large name filters run as a few bounded-size queries so the bind
+            # list never hits the 1000-entry cap or degenerate parse times.
+            result = []
+            upper_names = [table_name.upper() for table_name in tables]
+            for start in range(0, len(upper_names), _IN_LIST_BATCH_SIZE):
+                batch = upper_names[start : start + _IN_LIST_BATCH_SIZE]
+                placeholders = ", ".join(f":tbl_{idx}" for idx in range(len(batch)))
+                batch_params = dict(params)
+                batch_params.update({f"tbl_{idx}": name for idx, name in enumerate(batch)})
+                result.extend(self.connection.execute(text(build_sql(placeholders)), batch_params).fetchall())
+        else:
+            result = list(self.connection.execute(text(build_sql("")), params).fetchall())
 
-        self.connect()
-        result = self.connection.execute(text(sql), params).fetchall()
+        # Sort client-side; an unordered scan lets Oracle skip the sort step
+        # and catalog listings are small enough that Python sorts them cheaply.
+        result.sort(key=lambda row: (str(row[0]), str(row[1])))
 
         output = []
-        for owner, object_name in result:
+        for owner, object_name, object_kind in result:
             owner_name = str(owner)
             obj_name = str(object_name)
             output.append(
@@ -203,7 +366,7 @@ class OracleConnector(SQLAlchemyConnector):
                     "database_name": database_name or self.database_name,
                     "schema_name": owner_name,
                     "table_name": obj_name,
-                    "table_type": table_type,
+                    "table_type": str(object_kind),
                     "identifier": self.identifier(
                         catalog_name=catalog_name,
                         database_name=database_name or self.database_name,
@@ -212,24 +375,73 @@ class OracleConnector(SQLAlchemyConnector):
                     ),
                 }
             )
+
+        if cache_key is not None:
+            stamp = self._last_ddl_time(schema)
+            if stamp is not None:
+                self._objects_cache[cache_key] = (stamp, [dict(entry) for entry in output])
         return output
 
     def _fetch_object_ddl(self, object_type: str, owner: str, name: str) -> str:
-        """Fetch DDL via DBMS_METADATA."""
-        ddl_sql = text("SELECT DBMS_METADATA.GET_DDL(:object_type, :name) FROM dual")
+        """Fetch DDL via DBMS_METADATA (thread-safe: one pooled connection per call)."""
+        cache_key = (object_type, owner, name)
+        cached = self._object_ddl_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _DDL_CACHE_TTL_SECONDS:
+            return cached[1]
         try:
             self.connect()
-            row = self.connection.execute(
-                ddl_sql, {"object_type": object_type, "name": name, "owner": owner}
-            ).fetchone()
+            with self.engine.connect() as conn:
+                row = conn.execute(
+                    _SQL_DDL, {"object_type": object_type.replace(" ", "_"), "name": name, "owner": owner}
+                ).fetchone()
             if not row:
                 return f"-- DDL not available for {owner}.{name}"
             ddl = row[0]
-            return ddl.read() if hasattr(ddl, "read") else ddl
+            ddl_text = ddl.read() if hasattr(ddl, "read") else ddl
+            self._object_ddl_cache[cache_key] = (time.monotonic(), ddl_text)
+            return ddl_text
         except Exception as exc:
             logger.warning(f"Failed to get DDL for {owner}.{name}: {exc}")
             return f"-- DDL not available for {owner}.{name}: {exc}"
 
+    def _fetch_ddl_batch(self, object_type: str, keys: List[tuple]) -> Dict[tuple, str]:
+        """
+        Fetch DDL for many (owner, name) pairs in a few round trips.
+
+        DBMS_METADATA.GET_DDL is evaluated server-side over a multi-column IN
+        list, turning one round trip per object into one per 1000 objects.
+        Objects missing from the result (or whole failed batches) are left out
+        so the caller can fall back to per-object fetches.
+        """
+        ddl_map: Dict[tuple, str] = {}
+        self.connect()
+        for start in range(0, len(keys), _IN_LIST_BATCH_SIZE):
+            batch = keys[start : start + _IN_LIST_BATCH_SIZE]
+            pairs = ", ".join(f"(:o_{i}, :n_{i})" for i in range(len(batch)))
+            sql = text(
+                f"SELECT OWNER, OBJECT_NAME, DBMS_METADATA.GET_DDL(:ddl_type, OBJECT_NAME, OWNER) "
+                f"FROM ALL_OBJECTS WHERE OBJECT_TYPE = :object_type AND (OWNER, OBJECT_NAME) IN ({pairs})"
+            )
+            params: Dict[str, Any] = {
+                # GET_DDL uses underscores where ALL_OBJECTS uses spaces
+                # (MATERIALIZED_VIEW vs MATERIALIZED VIEW).
+                "ddl_type": object_type.replace(" ", "_"),
+                "object_type": object_type,
+            }
+            for i, (owner, name) in enumerate(batch):
+                params[f"o_{i}"] = owner
+                params[f"n_{i}"] = name
+
+            try:
+                rows = self.connection.execute(sql, params).fetchall()
+            except Exception as exc:
+                logger.warning(f"Batched DDL fetch failed, falling back to per-object fetches: {exc}")
+                continue
+
+            for owner, name, ddl in rows:
+                ddl_map[(str(owner), str(name))] = ddl.read() if hasattr(ddl, "read") else str(ddl)
+        return ddl_map
+
     def _objects_with_ddl(
         self,
         table_type: TABLE_TYPE,
@@ -242,14 +454,28 @@ class OracleConnector(SQLAlchemyConnector):
         if not entries:
             return []
 
-        object_type = {
-            "table": "TABLE",
-            "view": "VIEW",
-            "mv": "MATERIALIZED VIEW",
-        }.get(table_type, "TABLE")
-
+        # Each entry carries its own table_type (the "full" listing mixes
+        # kinds), so batch per DBMS_METADATA object type rather than per call.
+        groups: Dict[str, List[Dict[str, str]]] = {}
         for entry in entries:
-            entry["definition"] = self._fetch_object_ddl(object_type, entry["schema_name"], entry["table_name"])
+            groups.setdefault(_DDL_OBJECT_TYPE.get(entry["table_type"], "TABLE"), []).append(entry)
+
+        for object_type, group in groups.items():
+            ddl_map = self._fetch_ddl_batch(object_type, [(e["schema_name"], e["table_name"]) for e in group])
+
+            # Objects the batch could not resolve fall back to per-object GET_DDL
+            # calls; those are independent round trips, so run them concurrently.
+            missing = [e for e in group if (e["schema_name"], e["table_name"]) not in ddl_map]
+            if missing:
+                fallback_ddls = self._fetch_executor().map(
+                    lambda key, ot=object_type: self._fetch_object_ddl(ot, key[0], key[1]),
+                    [(e["schema_name"], e["table_name"]) for e in missing],
+                )
+                for entry, ddl in zip(missing, fallback_ddls):
+                    ddl_map[(entry["schema_name"], entry["table_name"])] = ddl
+
+            for entry in group:
+                entry["definition"] = ddl_map[(entry["schema_name"], entry["table_name"])]
         return entries
 
     @override
@@ -306,39 +532,17 @@ class OracleConnector(SQLAlchemyConnector):
         if not table_name:
             return []
 
-        owner = (schema_name or self.schema_name or self.config.username).upper()
-        sql = text(
-            """
-            SELECT
-                cols.COLUMN_ID,
-                cols.COLUMN_NAME,
-                cols.DATA_TYPE,
-                cols.DATA_LENGTH,
-                cols.DATA_PRECISION,
-                cols.DATA_SCALE,
-                cols.NULLABLE,
-                cols.DATA_DEFAULT,
-                pk.COLUMN_NAME AS PK_COLUMN
-            FROM ALL_TAB_COLUMNS cols
-            LEFT JOIN (
-                SELECT acc.COLUMN_NAME
-                FROM ALL_CONSTRAINTS ac
-                JOIN ALL_CONS_COLUMNS acc
-                    ON ac.CONSTRAINT_NAME = acc.CONSTRAINT_NAME
-                   AND ac.OWNER = acc.OWNER
-                WHERE ac.CONSTRAINT_TYPE = 'P'
-                  AND ac.OWNER = :owner
-                  AND ac.TABLE_NAME = :table_name
-            ) pk
-            ON cols.COLUMN_NAME = pk.COLUMN_NAME
-            WHERE cols.OWNER = :owner
-              AND cols.TABLE_NAME = :table_name
-            ORDER BY cols.COLUMN_ID
-            """
-        )
+        owner = self._resolve_owner(schema_name)
+
+        cache_key = (owner, table_name.upper())
+        cached = self._schema_cache.get(cache_key)
+        if cached is not None:
+            stamp = self._last_ddl_time(owner, table_name.upper())
+            if stamp is not None and stamp == cached[0]:
+                return [dict(column) for column in cached[1]]
 
         self.connect()
-        rows = self.connection.execute(sql, {"owner": owner, "table_name": table_name.upper()}).fetchall()
+        rows = self.connection.execute(_SQL_TABLE_COLUMNS, {"owner": owner, "table_name": table_name.upper()}).fetchall()
 
         result: List[Dict[str, Any]] = []
         for column_id, name, data_type, data_length, data_precision, data_scale, nullable, default, pk in rows:
@@ -361,6 +565,10 @@ class OracleConnector(SQLAlchemyConnector):
                     "pk": pk is not None,
                 }
             )
+
+        stamp = self._last_ddl_time(owner, table_name.upper())
+        if stamp is not None:
+            self._schema_cache[cache_key] = (stamp, [dict(column) for column in result])
         return result
 
     def get_sample_rows(
@@ -373,45 +581,81 @@ class OracleConnector(SQLAlchemyConnector):
         table_type: TABLE_TYPE = "table",
     ) -> List[Dict[str, Any]]:
         """Get sample rows using FETCH FIRST syntax."""
-        schema = (schema_name or self.schema_name or self.config.username).upper()
+        schema = self._resolve_owner(schema_name)
         if tables:
             targets = [{"schema_name": schema, "table_name": table} for table in tables]
         else:
             targets = self._list_objects(table_type, catalog_name, database_name, schema)
 
-        result: List[Dict[str, Any]] = []
         if not targets:
-            return result
+            return []
 
+        db_name = database_name or self.database_name
+        entries = []
         for entry in targets:
             owner = entry.get("schema_name") or schema
             table = entry["table_name"]
-            full_name = self.full_name(
+            # Listings from _list_objects already carry the identifier; only
+            # caller-supplied table names need the quoting walk here.
+            identifier = entry.get("identifier") or self.identifier(
                 catalog_name=catalog_name,
-                database_name=database_name or self.database_name,
+                database_name=db_name,
                 schema_name=owner,
                 table_name=table,
             )
-            query = f"SELECT * FROM {full_name} WHERE ROWNUM <= {top_n}"
-            df = self._execute_pandas(query)
-            if not df.empty:
-                result.append(
+            entries.append(
+                (
                     {
-                        "identifier": self.identifier(
-                            catalog_name=catalog_name,
-                            database_name=database_name or self.database_name,
-                            schema_name=owner,
-                            table_name=table,
-                        ),
+                        "identifier": identifier,
                         "catalog_name": catalog_name,
-                        "database_name": database_name or self.database_name,
+                        "database_name": db_name,
                         "schema_name": owner,
                         "table_name": table,
                         "table_type": table_type,
-                        "sample_rows": df.to_csv(index=False),
-                    }
+                    },
+                    self.full_name(
+                        catalog_name=catalog_name,
+                        database_name=db_name,
+                        schema_name=owner,
+                        table_name=table,
+                    ),
                 )
-        return result
+            )
+
+        # One ROWNUM-bounded SELECT per table is one round trip; running them
+        # over the shared pool turns M serial trips into ceil(M/workers).
+        samples = self._fetch_executor().map(
+            lambda full_name: self._fetch_sample_csv(full_name, top_n),
+            [full_name for _, full_name in entries],
+        )
+        return [
+            {**entry, "sample_rows": sample} for (entry, _), sample in zip(entries, samples) if sample is not None
+        ]
+
+    def _fetch_executor(self) -> ThreadPoolExecutor:
+        """Return the shared fetch pool, creating it on first use."""
+        if self._fetch_pool is None:
+            self._fetch_pool = ThreadPoolExecutor(max_workers=_FETCH_POOL_WORKERS, thread_name_prefix="oracle-fetch")
+        return self._fetch_pool
+
+    def _fetch_sample_csv(self, full_name: str, top_n: int) -> Optional[str]:
+        """Fetch up to ``top_n`` rows from a table as CSV, or None when empty."""
+        columns, rows = self._execute_keyed_tuples(f"SELECT * FROM {full_name} WHERE ROWNUM <= {top_n}")
+        if not rows:
+            return None
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerows(rows)
+        return buffer.getvalue()
+
+    @override
+    def close(self):
+        """Close the connection pool, releasing the fetch pool first."""
+        if self._fetch_pool is not None:
+            self._fetch_pool.shutdown(wait=False)
+            self._fetch_pool = None
+        super().close()
 
     # ==================== Utility Methods ====================
 
@@ -429,7 +673,10 @@ class OracleConnector(SQLAlchemyConnector):
         """Test database connection."""
         self.connect()
         try:
-            self._execute_query("SELECT 1 FROM DUAL")
+            # Connection.ping() is a bare OCI round trip: no parse, no cursor,
+            # no fetch, same raise-on-failure semantics as a probe query.
+            with self.engine.connect() as conn:
+                conn.connection.driver_connection.ping()
             return True
         except Exception as e:
             self._safe_close()
@@ -84,7 +84,14 @@ def test_switch_context_uses_alter_session(monkeypatch):
 def test_init_oracle_client_called(monkeypatch):
     calls = {"init": False, "init_kwargs": None, "thin_checked": False}
 
+    class DummyDefaults:
+        arraysize = 100
+        prefetchrows = 2
+        fetch_lobs = True
+
     class DummyOracle:
+        defaults = DummyDefaults()
+
         def is_thin_mode(self):
             calls["thin_checked"] = True
             return True
@@ -95,6 +102,9 @@ def test_init_oracle_client_called(monkeypatch):
 
     dummy = DummyOracle()
     monkeypatch.setattr("datus_oracle.connector.oracledb", dummy)
+    # The thick-mode attempt is once-per-process; connectors built by earlier
+    # tests have already consumed it, so rearm the flag for this one.
+    monkeypatch.setattr("datus_oracle.connector._thick_mode_checked", False)
 
     config = OracleConfig(
         host="localhost",
@@ -109,3 +119,7 @@ def test_init_oracle_client_called(monkeypatch):
     assert calls["thin_checked"] is True
     assert calls["init"] is True
     assert calls["init_kwargs"] == {"lib_dir": "/opt/oracle/instantclient"}
+
+    # Bulk-fetch defaults are applied to the driver at construction time.
+    assert dummy.defaults.arraysize > 100
+    assert dummy.defaults.fetch_lobs is False
@@ -14,7 +14,8 @@ class RedshiftConfig(BaseModel):
     # ConfigDict settings:
     # - extra="forbid": Prevents additional fields not defined in the model
     # - populate_by_name=True: Allows using field aliases (like 'schema' for 'schema_name')
-    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+    # - frozen=True: Makes instances immutable and hashable, safe to share across threads
+    model_config = ConfigDict(extra="forbid", populate_by_name=True, frozen=True)
 
     # Required fields (must be provided when creating a RedshiftConfig instance)
 
@@ -50,8 +51,12 @@ class RedshiftConfig(BaseModel):
 
     timeout_seconds: int = Field(default=30, description="Connection timeout in seconds")
 
-    # SSL mode for secure connections (default is "verify-ca" for production security)
-    # Options: "disable", "allow", "prefer", "require", "verify-ca", "verify-full"
+    # Extra sessions opened (lazily) for running independent read queries in parallel
+
+    pool_size: int = Field(default=4, description="Number of pooled connections for parallel reads")
+
+    # Whether to use SSL for the connection (redshift_connector's boolean flag;
+    # the driver applies its own sslmode default of "verify-ca" when enabled)
 
     ssl: bool = Field(default=True, description="Enable SSL connection")
 
@@ -72,6 +77,15 @@ class RedshiftConfig(BaseModel):
     access_key_id: Optional[str] = Field(default=None, description="AWS access key ID for IAM auth")
     secret_access_key: Optional[str] = Field(default=None, description="AWS secret access key for IAM auth")
 
+    # S3 staging for bulk reads (both must be set to enable execute_arrow_bulk)
+
+    unload_s3_prefix: Optional[str] = Field(
+        default=None, description="s3:// prefix where UNLOAD stages parquet output for bulk Arrow reads"
+    )
+    unload_iam_role: Optional[str] = Field(
+        default=None, description="IAM role ARN Redshift assumes when writing UNLOAD output"
+    )
+
     @model_validator(mode="after")
     def validate_authentication(self):
         """
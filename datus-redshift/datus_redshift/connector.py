@@ -3,13 +3,21 @@
 # See http://www.apache.org/licenses/LICENSE-2.0 for details.
 
 # Standard library imports
+import io
+import queue
 import re
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 # Import type hints for better code documentation and IDE support
 from typing import Any, Dict, List, Literal, Optional, Sequence, Set, Union, override
 
 # PyArrow is used for efficient data handling (columnar format)
 import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as pa_ds
+from pyarrow import fs as pa_fs
 
 # Import Redshift connector library
 import redshift_connector
@@ -43,6 +51,48 @@ from .config import RedshiftConfig
 # Get a logger instance for this module (for debugging and error messages)
 logger = get_logger(__name__)
 
+# How many rows to pull per fetchmany() call when streaming results into Arrow
+_ARROW_FETCH_BATCH_ROWS = 10_000
+
+# How many per-statement Arrow type signatures to remember (see _do_execute_arrow)
+_ARROW_TYPE_CACHE_MAX = 256
+
+# System namespaces hidden from listings unless include_sys is requested
+_SYS_DATABASES = frozenset({"padb_harvest", "information_schema"})
+_SYS_SCHEMAS = frozenset({"pg_catalog", "information_schema", "pg_internal"})
+
+# Postgres wire type OIDs (cursor.description[i][1]) mapped to Arrow types.
+# Passing an explicit type to pa.array skips the per-column inference scan;
+# anything unmapped (numeric, super, ...) falls back to inference.
+_PG_OID_TO_ARROW = {
+    16: pa.bool_(),  # bool
+    20: pa.int64(),  # int8
+    21: pa.int16(),  # int2
+    23: pa.int32(),  # int4
+    25: pa.string(),  # text
+    700: pa.float32(),  # float4
+    701: pa.float64(),  # float8
+    1042: pa.string(),  # bpchar
+    1043: pa.string(),  # varchar
+    1082: pa.date32(),  # date
+    1114: pa.timestamp("us"),  # timestamp
+    1184: pa.timestamp("us", tz="UTC"),  # timestamptz
+}
+
+
+# Driver exception class -> ErrorCode. The handler walks type(e).__mro__, so a
+# subclass maps like its closest listed base (e.g. anything deriving from
+# DatabaseError falls through to DB_EXECUTION_ERROR).
+_EXC_MAP = {
+    ProgrammingError: ErrorCode.DB_EXECUTION_SYNTAX_ERROR,  # syntax errors, invalid SQL
+    OperationalError: ErrorCode.DB_EXECUTION_ERROR,  # runtime/query execution problems
+    IntegrityError: ErrorCode.DB_CONSTRAINT_VIOLATION,  # unique/foreign key violations
+    InterfaceError: ErrorCode.DB_CONNECTION_FAILED,  # connection-level problems
+    InternalError: ErrorCode.DB_CONNECTION_FAILED,  # connection-level problems
+    DataError: ErrorCode.DB_EXECUTION_ERROR,  # invalid data types, overflow, etc.
+    DatabaseError: ErrorCode.DB_EXECUTION_ERROR,  # generic database errors
+}
+
 
 def _handle_redshift_exception(e: Exception, sql: str = "") -> DatusException:
     """
@@ -58,30 +108,16 @@ def _handle_redshift_exception(e: Exception, sql: str = "") -> DatusException:
     Returns:
         DatusException with appropriate error code and message
     """
-
-    # ProgrammingError = syntax errors, invalid SQL statements
-    if isinstance(e, ProgrammingError):
-        return DatusException(ErrorCode.DB_EXECUTION_SYNTAX_ERROR, message_args={"sql": sql, "error_message": str(e)})
-
-    # OperationalError/DatabaseError = runtime errors (connection issues, query execution problems)
-    elif isinstance(e, (OperationalError, DatabaseError)):
-        return DatusException(ErrorCode.DB_EXECUTION_ERROR, message_args={"sql": sql, "error_message": str(e)})
-
-    # IntegrityError = constraint violations (unique key, foreign key, etc.)
-    elif isinstance(e, IntegrityError):
-        return DatusException(ErrorCode.DB_CONSTRAINT_VIOLATION, message_args={"sql": sql, "error_message": str(e)})
-
-    # InterfaceError/InternalError = connection-level problems
-    elif isinstance(e, (InterfaceError, InternalError)):
-        return DatusException(ErrorCode.DB_CONNECTION_FAILED, message_args={"error_message": str(e)})
-
-    # DataError = data-related errors (invalid data types, overflow, etc.)
-    elif isinstance(e, DataError):
-        return DatusException(ErrorCode.DB_EXECUTION_ERROR, message_args={"sql": sql, "error_message": str(e)})
+    for cls in type(e).__mro__:
+        code = _EXC_MAP.get(cls)
+        if code is not None:
+            # Connection-level failures do not carry the failing statement
+            if code == ErrorCode.DB_CONNECTION_FAILED:
+                return DatusException(code, message_args={"error_message": str(e)})
+            return DatusException(code, message_args={"sql": sql, "error_message": str(e)})
 
     # Catch-all for any other exceptions
-    else:
-        return DatusException(ErrorCode.DB_FAILED, message_args={"error_message": str(e)})
+    return DatusException(ErrorCode.DB_FAILED, message_args={"error_message": str(e)})
 
 
 def _validate_sql_identifier(identifier: str, identifier_type: str = "identifier") -> None:
@@ -189,10 +225,32 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
         # Establish the connection to Redshift
         self.connection = redshift_connector.connect(**connection_params)
 
+        # Kept so the read pool can open additional sessions lazily
+        self._connection_params = connection_params
+        self._read_pool: Optional[queue.Queue] = None
+        self._read_pool_lock = threading.Lock()
+
+        # Lazily-created cursor reused for short metadata reads (see _metadata_cursor)
+        self._meta_cursor: Optional[redshift_connector.Cursor] = None
+
+        # Result-format name -> execution method, so execute_query can jump
+        # straight to the right path instead of walking an if/elif chain
+        self._format_dispatch = {
+            "csv": self.execute_csv,
+            "pandas": self.execute_pandas,
+            "arrow": self.execute_arrow,
+            "list": self._execute_list,
+        }
+
         # Store current context (database and schema)
         self.database_name = config.database or "dev"
         self.schema_name = config.schema_name or "public"
 
+        # Resolved Arrow column types per statement, keyed by the SQL text.
+        # Repeated queries (dashboards) then skip pyarrow's type inference
+        # scan on columns whose OID has no static mapping.
+        self._arrow_type_cache: Dict[str, tuple] = {}
+
     def test_connection(self) -> Dict[str, Any]:
         """
         Test the database connection by executing a simple query.
@@ -202,9 +260,9 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
         """
         try:
             # Execute a simple query to verify connection works
-            with self.connection.cursor() as cursor:
-                cursor.execute("SELECT 1")
-                cursor.fetchall()
+            cursor = self._metadata_cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
             return {
                 "success": True,
                 "message": "Connection successful",
@@ -214,8 +272,35 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
             # If connection test fails, raise appropriate exception
             raise _handle_redshift_exception(e, "SELECT 1")
 
+    def _metadata_cursor(self) -> redshift_connector.Cursor:
+        """
+        Return the shared cursor used for short metadata reads.
+
+        Cursor creation/teardown dominates the pg_class/pg_namespace lookups
+        themselves, so those reads share one lazily-created cursor. DML/DDL
+        keeps its own per-statement cursors for transaction boundaries.
+        """
+        if self._meta_cursor is None:
+            self._meta_cursor = self.connection.cursor()
+        return self._meta_cursor
+
     def close(self):
         """Close the database connection and free resources."""
+        if self._meta_cursor is not None:
+            try:
+                self._meta_cursor.close()
+            except Exception as e:
+                logger.warning(f"Failed to close metadata cursor: {e}")
+            self._meta_cursor = None
+        if self._read_pool is not None:
+            while not self._read_pool.empty():
+                conn = self._read_pool.get_nowait()
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception as e:
+                        logger.warning(f"Failed to close pooled connection: {e}")
+            self._read_pool = None
         if self.connection:
             self.connection.close()
 
@@ -237,7 +322,7 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
         Returns:
             Set of system database names
         """
-        return {"padb_harvest", "information_schema"}
+        return _SYS_DATABASES
 
     def _sys_schemas(self) -> Set[str]:
         """
@@ -248,7 +333,7 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
         Returns:
             Set of system schema names
         """
-        return {"pg_catalog", "information_schema", "pg_internal"}
+        return _SYS_SCHEMAS
 
     def do_switch_context(self, catalog_name: str = "", database_name: str = "", schema_name: str = ""):
         """
@@ -312,7 +397,10 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
                 raise ValueError("params must be dict or Sequence")
 
     def _do_execute_arrow(
-        self, sql_query: str, params: Optional[Sequence[Any] | dict[Any, Any]] = None
+        self,
+        sql_query: str,
+        params: Optional[Sequence[Any] | dict[Any, Any]] = None,
+        connection: Optional[redshift_connector.Connection] = None,
     ) -> tuple[pa.Table, int]:
         """
         Execute SQL query and return results in Apache Arrow format.
@@ -330,33 +418,76 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
             DatusException: If query execution fails
         """
         try:
-            with self.connection.cursor() as cursor:
+            with (connection or self.connection).cursor() as cursor:
                 # Execute the query with parameters if provided
                 if params:
                     cursor.execute(sql_query, params)
                 else:
                     cursor.execute(sql_query)
 
-                # Fetch all results
-                results = cursor.fetchall()
-
-                # Get column names from cursor description
-                column_names = [desc[0] for desc in cursor.description] if cursor.description else []
-
-                # Convert results to Arrow table
-                if results and column_names:
-                    # Transpose rows to columns for Arrow
-                    columns = list(zip(*results)) if results else [[] for _ in column_names]
+                description = cursor.description or []
+                column_names = [desc[0] for desc in description]
+                if not column_names:
+                    # Statement produced no result set
+                    return pa.table([]), 0
 
-                    # Create Arrow arrays for each column
-                    arrow_arrays = [pa.array(col) for col in columns]
+                # Stream fetchmany batches straight into per-column builders.
+                # This replaces fetchall + zip(*rows), which materialized the
+                # whole rowset twice before Arrow ever saw it.
+                columns: list[list] = [[] for _ in column_names]
+                row_count = 0
+                while True:
+                    rows = cursor.fetchmany(_ARROW_FETCH_BATCH_ROWS)
+                    if not rows:
+                        break
+                    row_count += len(rows)
+                    for row in rows:
+                        for values, value in zip(columns, row):
+                            values.append(value)
+
+                # Build one Arrow array per column, typed from the cursor
+                # description where the OID is known, or from the types this
+                # statement resolved to on a previous execution
+                cached_types = self._arrow_type_cache.get(sql_query)
+                if cached_types is not None and len(cached_types) != len(columns):
+                    cached_types = None
+
+                if row_count == 0:
+                    # Empty result: skip the array builders but keep the
+                    # column names and types on the zero-row table
+                    types = [
+                        (cached_types[i] if cached_types else None) or _PG_OID_TO_ARROW.get(desc[1], pa.string())
+                        for i, desc in enumerate(description)
+                    ]
+                    empty = pa.Table.from_arrays([pa.array([], type=t) for t in types], names=column_names)
+                    return empty, 0
+
+                def build_array(i: int, values: list, desc) -> pa.Array:
+                    arrow_type = (cached_types[i] if cached_types else None) or _PG_OID_TO_ARROW.get(desc[1])
+                    if arrow_type is None:
+                        return pa.array(values)
+                    try:
+                        return pa.array(values, type=arrow_type)
+                    except (pa.ArrowInvalid, pa.ArrowTypeError):
+                        # A remembered type can stop fitting the data; fall
+                        # back to inference rather than failing the query
+                        return pa.array(values)
+
+                arrow_arrays = [
+                    build_array(i, values, desc) for i, (values, desc) in enumerate(zip(columns, description))
+                ]
+
+                # Remember the resolved types, leaving all-NULL columns
+                # unpinned so real values on a later run still infer cleanly
+                if sql_query not in self._arrow_type_cache and len(self._arrow_type_cache) >= _ARROW_TYPE_CACHE_MAX:
+                    # Drop the oldest entry (insertion order) to cap memory
+                    self._arrow_type_cache.pop(next(iter(self._arrow_type_cache)))
+                self._arrow_type_cache[sql_query] = tuple(
+                    None if pa.types.is_null(array.type) else array.type for array in arrow_arrays
+                )
 
-                    # Create Arrow table
-                    arrow_table = pa.Table.from_arrays(arrow_arrays, names=column_names)
-                    return arrow_table, len(results)
-                else:
-                    # Return empty table if no results
-                    return pa.table([]), 0
+                arrow_table = pa.Table.from_arrays(arrow_arrays, names=column_names)
+                return arrow_table, row_count
 
         except Exception as e:
             raise _handle_redshift_exception(e, sql_query)
@@ -377,16 +508,21 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
             Pandas DataFrame with query results
         """
         try:
-            # Get Arrow table first
-            arrow_table, _ = self._do_execute_arrow(sql, params)
+            with self.connection.cursor() as cursor:
+                if params:
+                    cursor.execute(sql, params)
+                else:
+                    cursor.execute(sql)
 
-            # Convert Arrow to pandas DataFrame
-            return arrow_table.to_pandas()
+                # fetch_dataframe builds the frame from the driver's columnar
+                # buffers directly, skipping the rows -> Arrow -> pandas hops
+                df = cursor.fetch_dataframe()
+                return df if df is not None else DataFrame()
         except DatusException:
-            # Already normalized by _do_execute_arrow, just bubble up
+            # Already normalized, just bubble up
             raise
         except Exception as e:
-            # Normalize any new driver/runtime exceptions
+            # Normalize any driver/runtime exceptions
             raise _handle_redshift_exception(e, sql) from e
 
     def execute_query_to_dict(self, sql: str) -> List[Dict[str, Any]]:
@@ -401,29 +537,14 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
         Returns:
             List of dictionaries, one per row
         """
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute(sql)
-                results = cursor.fetchall()
-
-                # If no results, return empty list
-                if not results:
-                    return []
-
-                # Get column names
-                column_names = [desc[0] for desc in cursor.description]
-
-                # Convert each row to dictionary
-                result = []
-                for row in results:
-                    row_dict = {}
-                    for i, col_name in enumerate(column_names):
-                        row_dict[col_name] = row[i]
-                    result.append(row_dict)
+        # If no results, return empty list
+        arrow_table, row_count = self._do_execute_arrow(sql)
+        if row_count == 0:
+            return []
 
-                return result
-        except Exception as e:
-            raise _handle_redshift_exception(e, sql)
+        # to_pylist does the row -> dict conversion in C++, replacing the
+        # per-cell Python loop this method used to run
+        return arrow_table.to_pylist()
 
     @override
     def execute_ddl(self, sql: str) -> ExecuteSQLResult:
@@ -591,19 +712,39 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
             ExecuteSQLResult with results in requested format
         """
         # Route to appropriate execution method based on format
-        if result_format == "csv":
-            return self.execute_csv(sql)
-        elif result_format == "pandas":
-            return self.execute_pandas(sql)
-        else:
-            result = self.execute_arrow(sql)
-            if result_format == "arrow":
-                return result
-            # Convert Arrow to list if requested
-            if result and result.success:
-                result.sql_return = result.sql_return.to_pylist()
-                result.result_format = result_format
-            return result
+        handler = self._format_dispatch.get(result_format)
+        if handler is not None:
+            return handler(sql)
+
+        # Unrecognized formats keep the historical behavior: rows converted
+        # to a list of dicts, stamped with the requested format
+        result = self._execute_list(sql)
+        if result.success:
+            result.result_format = result_format
+        return result
+
+    def _execute_list(self, sql: str) -> ExecuteSQLResult:
+        """
+        Execute query and return rows as a list of dictionaries.
+
+        Args:
+            sql: SQL query to execute
+
+        Returns:
+            ExecuteSQLResult with list of row dictionaries
+        """
+        try:
+            arrow_table, row_count = self._do_execute_arrow(sql)
+            return ExecuteSQLResult(
+                sql_query=sql,
+                row_count=row_count,
+                sql_return=arrow_table.to_pylist(),
+                success=True,
+                error=None,
+                result_format="list",
+            )
+        except DatusException as e:
+            return ExecuteSQLResult(success=False, sql_query=sql, result_format="list", error=str(e))
 
     def execute_arrow(self, sql: str, params: Optional[Sequence[Any] | dict[Any, Any]] = None) -> ExecuteSQLResult:
         """
@@ -638,6 +779,121 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
         except DatusException as e:
             return ExecuteSQLResult(success=False, sql_query=sql, error=str(e))
 
+    def execute_arrow_stream(self, sql: str, batch_size: int = 50_000) -> pa.RecordBatchReader:
+        """
+        Execute a query and stream the results as Arrow record batches.
+
+        Unlike execute_arrow, which materializes the whole result as one table,
+        this holds at most one batch of rows in memory and hands batches to the
+        consumer as they are fetched, so decoding pipelines with the network
+        reads. The cursor stays open until the reader is exhausted or closed.
+
+        Args:
+            sql: SQL query to execute
+            batch_size: Number of rows fetched per batch
+
+        Returns:
+            pyarrow.RecordBatchReader yielding the result batches
+        """
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(sql)
+        except Exception as e:
+            cursor.close()
+            raise _handle_redshift_exception(e, sql)
+
+        description = cursor.description or []
+        column_names = [desc[0] for desc in description]
+
+        # The schema must be fixed before the first batch, so unmapped OIDs
+        # fall back to string. Their values (Decimal, time, super, ...) are
+        # stringified explicitly because Arrow raises rather than coercing
+        # arbitrary Python objects to a string column.
+        stringify = tuple(desc[1] not in _PG_OID_TO_ARROW for desc in description)
+        schema = pa.schema(
+            pa.field(name, _PG_OID_TO_ARROW.get(desc[1], pa.string())) for name, desc in zip(column_names, description)
+        )
+
+        def column_values(rows, i):
+            if stringify[i]:
+                return [None if row[i] is None else str(row[i]) for row in rows]
+            return [row[i] for row in rows]
+
+        def batches():
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield pa.RecordBatch.from_pydict(
+                        {name: column_values(rows, i) for i, name in enumerate(column_names)},
+                        schema=schema,
+                    )
+            finally:
+                cursor.close()
+
+        return pa.RecordBatchReader.from_batches(schema, batches())
+
+    def execute_arrow_bulk(self, sql: str) -> ExecuteSQLResult:
+        """
+        Execute a large SELECT by staging the result in S3 via UNLOAD.
+
+        UNLOAD writes parquet shards in parallel from the compute nodes, which
+        bypasses the row-based wire protocol entirely; reading the shards back
+        with pyarrow.dataset is much faster than cursor fetches for results in
+        the millions of rows. Requires unload_s3_prefix and unload_iam_role in
+        the config; falls back to the in-protocol path when unconfigured or
+        for non-SELECT statements.
+
+        Args:
+            sql: SELECT query to execute
+
+        Returns:
+            ExecuteSQLResult with Arrow table
+        """
+        config = self.redshift_config
+        if not (config.unload_s3_prefix and config.unload_iam_role) or not sql.lstrip().upper().startswith("SELECT"):
+            return self.execute_arrow(sql)
+
+        # Unique staging directory per call so concurrent reads never collide
+        staging_uri = f"{config.unload_s3_prefix.rstrip('/')}/{uuid.uuid4().hex}/"
+
+        # $$-quoting avoids escaping single quotes inside the wrapped query
+        unload_sql = (
+            f"UNLOAD ($${sql}$$) TO '{staging_uri}' "
+            f"IAM_ROLE '{config.unload_iam_role}' "
+            "FORMAT PARQUET PARALLEL ON MAXFILESIZE 256 MB"
+        )
+
+        # pyarrow's S3 filesystem wants the path without the s3:// scheme
+        filesystem = pa_fs.S3FileSystem(region=config.region) if config.region else pa_fs.S3FileSystem()
+        staging_path = staging_uri[len("s3://") :]
+
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.execute(unload_sql)
+
+            arrow_table = pa_ds.dataset(staging_path, format="parquet", filesystem=filesystem).to_table(
+                use_threads=True
+            )
+            return ExecuteSQLResult(
+                sql_query=sql,
+                row_count=arrow_table.num_rows,
+                sql_return=arrow_table,
+                success=True,
+                error=None,
+                result_format="arrow",
+            )
+        except Exception as e:
+            ex = _handle_redshift_exception(e, sql)
+            return ExecuteSQLResult(success=False, sql_query=sql, error=str(ex))
+        finally:
+            # Best-effort cleanup of the staged shards
+            try:
+                filesystem.delete_dir_contents(staging_path.rstrip("/"), missing_dir_ok=True)
+            except Exception as cleanup_error:
+                logger.warning(f"Failed to clean up UNLOAD staging at {staging_uri}: {cleanup_error}")
+
     def execute_pandas(self, sql: str) -> ExecuteSQLResult:
         """
         Execute query and return results as pandas DataFrame.
@@ -672,12 +928,27 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
         Returns:
             ExecuteSQLResult with CSV formatted results
         """
-        result = self.execute_pandas(query)
-        result.result_format = "csv"
-        # Convert DataFrame to CSV if query was successful
-        if result.success and result.row_count > 0:
-            result.sql_return = result.sql_return.to_csv(index=False)
-        return result
+        try:
+            arrow_table, row_count = self._do_execute_arrow(query)
+
+            # write_csv streams the columns in C++, skipping the pandas
+            # materialization and second pass this method used to make
+            sql_return = None
+            if row_count > 0:
+                buffer = io.BytesIO()
+                pa_csv.write_csv(arrow_table, buffer, write_options=pa_csv.WriteOptions(include_header=True))
+                sql_return = buffer.getvalue().decode("utf-8")
+
+            return ExecuteSQLResult(
+                sql_query=query,
+                row_count=row_count,
+                sql_return=sql_return,
+                success=True,
+                error=None,
+                result_format="csv",
+            )
+        except DatusException as e:
+            return ExecuteSQLResult(success=False, sql_query=query, result_format="csv", error=str(e))
 
     def execute_queries(self, queries: List[str]) -> List[ExecuteSQLResult]:
         """
@@ -691,17 +962,124 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
         """
         return [self.execute_query(sql) for sql in queries]
 
+    def execute_batch(self, queries: List[str]) -> List[ExecuteSQLResult]:
+        """
+        Execute multiple DML/DDL statements on one cursor with one commit.
+
+        Per-statement commits each cost a network round trip; batching defers
+        to a single commit once every statement has run. On the first failure
+        the whole batch is rolled back and the remaining statements are
+        reported as skipped.
+
+        Args:
+            queries: List of SQL statements to execute
+
+        Returns:
+            List of ExecuteSQLResult, one per statement
+        """
+        results: List[ExecuteSQLResult] = []
+
+        with self.connection.cursor() as cursor:
+            for index, sql in enumerate(queries):
+                try:
+                    cursor.execute(sql)
+                    rowcount = cursor.rowcount if cursor.rowcount else 0
+                    results.append(
+                        ExecuteSQLResult(
+                            sql_query=sql,
+                            row_count=rowcount,
+                            sql_return=str(rowcount),
+                            success=True,
+                            error=None,
+                        )
+                    )
+                except Exception as e:
+                    # Undo everything executed so far and fail out the rest
+                    self.connection.rollback()
+                    ex = _handle_redshift_exception(e, sql)
+                    results.append(ExecuteSQLResult(success=False, sql_query=sql, error=str(ex)))
+                    results.extend(
+                        ExecuteSQLResult(
+                            success=False,
+                            sql_query=remaining,
+                            error="Skipped: earlier statement in the batch failed",
+                        )
+                        for remaining in queries[index + 1 :]
+                    )
+                    return results
+
+        try:
+            # One commit for the whole batch
+            self.connection.commit()
+        except Exception as e:
+            self.connection.rollback()
+            ex = _handle_redshift_exception(e)
+            return [ExecuteSQLResult(success=False, sql_query=sql, error=str(ex)) for sql in queries]
+
+        return results
+
     def execute_queries_arrow(self, queries: List[str]) -> List[ExecuteSQLResult]:
         """
-        Execute multiple queries and return Arrow results.
+        Execute multiple queries concurrently and return Arrow results.
+
+        Independent reads run on separate pooled sessions; the driver releases
+        the GIL during network I/O, so a small thread pool turns this
+        latency-bound loop into ceil(N/pool_size) round-trip waits.
 
         Args:
             queries: List of SQL queries to execute
 
         Returns:
-            List of ExecuteSQLResult with Arrow tables
+            List of ExecuteSQLResult with Arrow tables, in query order
+        """
+        if len(queries) <= 1:
+            return [self.execute_arrow(sql) for sql in queries]
+
+        workers = min(self.redshift_config.pool_size, len(queries))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="redshift-read") as executor:
+            return list(executor.map(self._execute_arrow_pooled, queries))
+
+    def _execute_arrow_pooled(self, sql: str) -> ExecuteSQLResult:
+        """Run one Arrow query on a pooled connection (worker for execute_queries_arrow)."""
+        conn = self._acquire_read_connection()
+        try:
+            arrow_table, row_count = self._do_execute_arrow(sql, connection=conn)
+            return ExecuteSQLResult(
+                sql_query=sql,
+                row_count=row_count,
+                sql_return=arrow_table,
+                success=True,
+                error=None,
+                result_format="arrow",
+            )
+        except DatusException as e:
+            return ExecuteSQLResult(success=False, sql_query=sql, error=str(e))
+        finally:
+            self._release_read_connection(conn)
+
+    def _acquire_read_connection(self) -> redshift_connector.Connection:
+        """
+        Take a connection from the read pool, opening it lazily.
+
+        The pool starts as placeholders so no extra sessions are opened until
+        parallel reads actually happen.
         """
-        return [self.execute_arrow(sql) for sql in queries]
+        if self._read_pool is None:
+            with self._read_pool_lock:
+                if self._read_pool is None:
+                    pool = queue.Queue(maxsize=self.redshift_config.pool_size)
+                    for _ in range(self.redshift_config.pool_size):
+                        pool.put(None)
+                    self._read_pool = pool
+
+        conn = self._read_pool.get()
+        if conn is None:
+            conn = redshift_connector.connect(**self._connection_params)
+        return conn
+
+    def _release_read_connection(self, conn: redshift_connector.Connection):
+        """Return a connection to the read pool."""
+        self._read_pool.put(conn)
 
     @override
     def get_databases(self, catalog_name: str = "", include_sys: bool = False) -> List[str]:
@@ -715,22 +1093,22 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
         Returns:
             List of database names
         """
-        # Query system catalog to get database list
+        # Query system catalog to get database list, filtering system
+        # databases server-side so their rows never cross the wire
         sql = "SELECT datname FROM pg_database WHERE datistemplate = false"
+        params: tuple = ()
+        if not include_sys:
+            sys_databases = sorted(_SYS_DATABASES)
+            sql += f" AND datname NOT IN ({', '.join(['%s'] * len(sys_databases))})"
+            params = tuple(sys_databases)
 
         try:
-            databases = []
-            with self.connection.cursor() as cursor:
+            cursor = self._metadata_cursor()
+            if params:
+                cursor.execute(sql, params)
+            else:
                 cursor.execute(sql)
-                results = cursor.fetchall()
-
-                for row in results:
-                    db_name = row[0]
-                    # Filter out system databases if requested
-                    if include_sys or db_name not in self._sys_databases():
-                        databases.append(db_name)
-
-            return databases
+            return [row[0] for row in cursor.fetchall()]
         except Exception as e:
             raise _handle_redshift_exception(e, sql)
 
@@ -747,29 +1125,34 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
         Returns:
             List of schema names
         """
-        # Query system catalog to get schema list
-        sql = """
-            SELECT nspname
-            FROM pg_namespace
-            WHERE nspname NOT LIKE 'pg_temp_%'
-            AND nspname NOT LIKE 'pg_toast%'
-        """
-
+        # Query system catalog to get schema list, filtering system schemas
+        # server-side so their rows never cross the wire. The literal percent
+        # signs in the LIKE patterns are doubled on the parameterized path
+        # because the driver's %s placeholder conversion only runs when
+        # parameters are supplied.
         try:
-            schemas = []
-            with self.connection.cursor() as cursor:
+            cursor = self._metadata_cursor()
+            if include_sys:
+                sql = """
+                    SELECT nspname
+                    FROM pg_namespace
+                    WHERE nspname NOT LIKE 'pg_temp_%'
+                    AND nspname NOT LIKE 'pg_toast%'
+                """
                 cursor.execute(sql)
-                results = cursor.fetchall()
-
-                for row in results:
-                    schema_name = row[0]
-                    # Filter out system schemas if requested
-                    if include_sys or schema_name not in self._sys_schemas():
-                        schemas.append(schema_name)
-
-            return schemas
+            else:
+                sys_schemas = sorted(_SYS_SCHEMAS)
+                sql = f"""
+                    SELECT nspname
+                    FROM pg_namespace
+                    WHERE nspname NOT LIKE 'pg_temp_%%'
+                    AND nspname NOT LIKE 'pg_toast%%'
+                    AND nspname NOT IN ({', '.join(['%s'] * len(sys_schemas))})
+                """
+                cursor.execute(sql, tuple(sys_schemas))
+            return [row[0] for row in cursor.fetchall()]
         except Exception as e:
-            raise _handle_redshift_exception(e, sql)
+            raise _handle_redshift_exception(e, "get_schemas")
 
     @override
     def get_tables(self, catalog_name: str = "", database_name: str = "", schema_name: str = "") -> List[str]:
@@ -849,15 +1232,18 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
         schema_name = schema_name or self.schema_name
         result = []
 
-        # Build the WHERE clause for schema filtering
+        # Build the WHERE clause for schema filtering; values travel as bind
+        # parameters so the server can reuse the prepared plan across calls
         if schema_name:
             # Validate schema name to prevent SQL injection
             _validate_sql_identifier(schema_name, "schema")
-            schema_filter = f"n.nspname = '{schema_name}'"
+            schema_filter = "n.nspname = %s"
+            schema_params = [schema_name]
         else:
             # Exclude system schemas
-            sys_schemas_str = ", ".join([f"'{s}'" for s in self._sys_schemas()])
-            schema_filter = f"n.nspname NOT IN ({sys_schemas_str})"
+            sys_schemas = sorted(self._sys_schemas())
+            schema_filter = f"n.nspname NOT IN ({', '.join(['%s'] * len(sys_schemas))})"
+            schema_params = sys_schemas
 
         # Get tables if requested
         if table_type in ("table", "full"):
@@ -875,28 +1261,29 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
             """
 
             # Add table name filter if specific tables requested
+            params = list(schema_params)
             if tables:
-                tables_str = ", ".join([f"'{t}'" for t in tables])
-                sql += f" AND c.relname IN ({tables_str})"
+                sql += f" AND c.relname IN ({', '.join(['%s'] * len(tables))})"
+                params.extend(tables)
 
             try:
-                with self.connection.cursor() as cursor:
-                    cursor.execute(sql)
-                    for row in cursor.fetchall():
-                        result.append(
-                            {
-                                "catalog_name": "",
-                                "database_name": self.database_name,
-                                "schema_name": row[0],
-                                "table_name": row[1],
-                                "table_type": "table",
-                                "identifier": self.identifier(
-                                    database_name=self.database_name,
-                                    schema_name=row[0],
-                                    table_name=row[1],
-                                ),
-                            }
-                        )
+                cursor = self._metadata_cursor()
+                cursor.execute(sql, tuple(params))
+                for row in cursor.fetchall():
+                    result.append(
+                        {
+                            "catalog_name": "",
+                            "database_name": self.database_name,
+                            "schema_name": row[0],
+                            "table_name": row[1],
+                            "table_type": "table",
+                            "identifier": self.identifier(
+                                database_name=self.database_name,
+                                schema_name=row[0],
+                                table_name=row[1],
+                            ),
+                        }
+                    )
             except Exception as e:
                 logger.warning(f"Failed to get tables: {e}")
 
@@ -915,28 +1302,29 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
                 WHERE c.relkind = 'v' AND {schema_filter}
             """
 
+            params = list(schema_params)
             if tables:
-                tables_str = ", ".join([f"'{t}'" for t in tables])
-                sql += f" AND c.relname IN ({tables_str})"
+                sql += f" AND c.relname IN ({', '.join(['%s'] * len(tables))})"
+                params.extend(tables)
 
             try:
-                with self.connection.cursor() as cursor:
-                    cursor.execute(sql)
-                    for row in cursor.fetchall():
-                        result.append(
-                            {
-                                "catalog_name": "",
-                                "database_name": self.database_name,
-                                "schema_name": row[0],
-                                "table_name": row[1],
-                                "table_type": "view",
-                                "identifier": self.identifier(
-                                    database_name=self.database_name,
-                                    schema_name=row[0],
-                                    table_name=row[1],
-                                ),
-                            }
-                        )
+                cursor = self._metadata_cursor()
+                cursor.execute(sql, tuple(params))
+                for row in cursor.fetchall():
+                    result.append(
+                        {
+                            "catalog_name": "",
+                            "database_name": self.database_name,
+                            "schema_name": row[0],
+                            "table_name": row[1],
+                            "table_type": "view",
+                            "identifier": self.identifier(
+                                database_name=self.database_name,
+                                schema_name=row[0],
+                                table_name=row[1],
+                            ),
+                        }
+                    )
             except Exception as e:
                 logger.warning(f"Failed to get views: {e}")
 
@@ -955,28 +1343,29 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
                 WHERE c.relkind = 'm' AND {schema_filter}
             """
 
+            params = list(schema_params)
             if tables:
-                tables_str = ", ".join([f"'{t}'" for t in tables])
-                sql += f" AND c.relname IN ({tables_str})"
+                sql += f" AND c.relname IN ({', '.join(['%s'] * len(tables))})"
+                params.extend(tables)
 
             try:
-                with self.connection.cursor() as cursor:
-                    cursor.execute(sql)
-                    for row in cursor.fetchall():
-                        result.append(
-                            {
-                                "catalog_name": "",
-                                "database_name": self.database_name,
-                                "schema_name": row[0],
-                                "table_name": row[1],
-                                "table_type": "mv",
-                                "identifier": self.identifier(
-                                    database_name=self.database_name,
-                                    schema_name=row[0],
-                                    table_name=row[1],
-                                ),
-                            }
-                        )
+                cursor = self._metadata_cursor()
+                cursor.execute(sql, tuple(params))
+                for row in cursor.fetchall():
+                    result.append(
+                        {
+                            "catalog_name": "",
+                            "database_name": self.database_name,
+                            "schema_name": row[0],
+                            "table_name": row[1],
+                            "table_type": "mv",
+                            "identifier": self.identifier(
+                                database_name=self.database_name,
+                                schema_name=row[0],
+                                table_name=row[1],
+                            ),
+                        }
+                    )
             except Exception as e:
                 logger.warning(f"Failed to get materialized views: {e}")
 
@@ -1030,28 +1419,28 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
             schemas = []
             columns_list = []
 
-            with self.connection.cursor() as cursor:
-                cursor.execute(sql)
-                results = cursor.fetchall()
-
-                for idx, row in enumerate(results):
-                    column_name = row[0]
-                    data_type = row[1]
-                    nullable = row[2] == "YES"
-                    default_value = row[3]
-
-                    column_info = {
-                        "cid": idx,
-                        "name": column_name,
-                        "type": data_type,
-                        "nullable": nullable,
-                        "pk": False,  # Would need to query pg_constraint for this
-                        "default_value": default_value,
-                        "comment": None,
-                    }
-
-                    schemas.append(column_info)
-                    columns_list.append({"name": column_name, "type": data_type})
+            cursor = self._metadata_cursor()
+            cursor.execute(sql)
+            results = cursor.fetchall()
+
+            for idx, row in enumerate(results):
+                column_name = row[0]
+                data_type = row[1]
+                nullable = row[2] == "YES"
+                default_value = row[3]
+
+                column_info = {
+                    "cid": idx,
+                    "name": column_name,
+                    "type": data_type,
+                    "nullable": nullable,
+                    "pk": False,  # Would need to query pg_constraint for this
+                    "default_value": default_value,
+                    "comment": None,
+                }
+
+                schemas.append(column_info)
+                columns_list.append({"name": column_name, "type": data_type})
 
             # Add summary information
             schemas.append(
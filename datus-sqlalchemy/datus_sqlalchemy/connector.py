@@ -39,7 +39,14 @@ class SQLAlchemyConnector(BaseSqlConnector):
     Provides common SQLAlchemy functionality with Arrow support.
     """
 
-    def __init__(self, connection_string: str, dialect: str = "", timeout_seconds: int = 30):
+    def __init__(
+        self,
+        connection_string: str,
+        dialect: str = "",
+        timeout_seconds: int = 30,
+        pool_size: int = 10,
+        max_overflow: int = 20,
+    ):
         """
         Initialize SQLAlchemyConnector.
 
@@ -47,6 +54,8 @@ class SQLAlchemyConnector(BaseSqlConnector):
             connection_string: SQLAlchemy connection string
             dialect: Database dialect (mysql, postgresql, etc.)
             timeout_seconds: Connection timeout in seconds
+            pool_size: Number of persistent pooled connections
+            max_overflow: Extra connections allowed beyond pool_size under load
         """
         # Auto-detect dialect from connection string if not provided
         if not dialect:
@@ -56,9 +65,13 @@ class SQLAlchemyConnector(BaseSqlConnector):
         config = ConnectionConfig(timeout_seconds=timeout_seconds)
         super().__init__(config, dialect)
         self.connection_string = connection_string
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
         self.engine = None
         self.connection = None
         self._owns_engine = False
+        # Inspector reused across metadata calls; rebuilt when the engine is.
+        self._cached_inspector: Optional[Inspector] = None
 
     def __del__(self):
         """Destructor to ensure connections are properly closed."""
@@ -82,8 +95,8 @@ class SQLAlchemyConnector(BaseSqlConnector):
             if self.dialect not in (DBType.DUCKDB, DBType.SQLITE):
                 self.engine = create_engine(
                     self.connection_string,
-                    pool_size=10,  # Increased for parallel execution
-                    max_overflow=20,  # Allow more overflow connections
+                    pool_size=self.pool_size,  # Sized to expected concurrency
+                    max_overflow=self.max_overflow,  # Allow more overflow connections
                     pool_timeout=self.timeout_seconds,
                     pool_recycle=3600,
                     pool_pre_ping=True,  # Verify connections before use
@@ -107,6 +120,7 @@ class SQLAlchemyConnector(BaseSqlConnector):
     def close(self):
         """Dispose the connection pool."""
         try:
+            self._cached_inspector = None
             if self.engine:
                 self.engine.dispose()
                 self.engine = None
@@ -261,6 +275,49 @@ class SQLAlchemyConnector(BaseSqlConnector):
         except Exception as e:
             raise self._handle_exception(e, sql, "query") from e
 
+    def _execute_tuples(
+        self, sql: str, params: Optional[Dict[str, Any]] = None, preamble: Optional[str] = None
+    ) -> List[Tuple[Any, ...]]:
+        """
+        Internal query execution returning raw row tuples.
+
+        Skips per-row dict and DataFrame construction for callers that only
+        iterate a couple of columns (e.g. metadata listings). Bind parameters
+        keep query text stable so the server can reuse cached plans. An optional
+        ``preamble`` statement (e.g. a context switch) runs on the same pooled
+        connection immediately before the query, avoiding a separate checkout.
+        """
+        self.connect()
+        try:
+            with self.engine.connect() as conn:
+                if preamble:
+                    conn.execute(text(preamble))
+                result = conn.execute(text(sql), params or {})
+                return [tuple(row) for row in result.fetchall()]
+        except DatusException:
+            raise
+        except Exception as e:
+            raise self._handle_exception(e, sql, "query") from e
+
+    def _execute_keyed_tuples(
+        self, sql: str, params: Optional[Dict[str, Any]] = None, preamble: Optional[str] = None
+    ) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+        """
+        Like :meth:`_execute_tuples` but also returns the result column names,
+        for callers that select columns by name without needing a DataFrame.
+        """
+        self.connect()
+        try:
+            with self.engine.connect() as conn:
+                if preamble:
+                    conn.execute(text(preamble))
+                result = conn.execute(text(sql), params or {})
+                return list(result.keys()), [tuple(row) for row in result.fetchall()]
+        except DatusException:
+            raise
+        except Exception as e:
+            raise self._handle_exception(e, sql, "query") from e
+
     @override
     def execute_insert(self, sql: str) -> ExecuteSQLResult:
         """Execute INSERT statement."""
@@ -456,10 +513,13 @@ class SQLAlchemyConnector(BaseSqlConnector):
     # ==================== Metadata Methods ====================
 
     def _inspector(self) -> Inspector:
-        """Get SQLAlchemy inspector."""
+        """Get SQLAlchemy inspector, reusing one instance per engine."""
         self.connect()
+        if self._cached_inspector is not None and self._cached_inspector.engine is self.engine:
+            return self._cached_inspector
         try:
-            return inspect(self.engine)
+            self._cached_inspector = inspect(self.engine)
+            return self._cached_inspector
         except Exception as e:
             raise self._handle_exception(e, operation="inspector creation") from e
 